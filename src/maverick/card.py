@@ -1,11 +1,12 @@
 import random
+from functools import cached_property
 from typing import Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from .enums import Suit, Rank, HandType
 from .utils.scoring import score_hand
-
+from .utils.evaluator import card_to_int
 
 __all__ = ["Card"]
 
@@ -13,6 +14,11 @@ __all__ = ["Card"]
 class Card(BaseModel):
     """A playing card with a suit and rank.
 
+    Cards are immutable, so the same instances can be shared by every deck.
+
+    .. versionchanged:: 0.3.0
+        Cards are frozen and hashable.
+
     Fields
     ------
     suit : Suit
@@ -28,6 +34,8 @@ class Card(BaseModel):
     'A♥'
     """
 
+    model_config = ConfigDict(frozen=True)
+
     suit: Suit
     rank: Rank
 
@@ -40,6 +48,16 @@ class Card(BaseModel):
         selected = random.sample(all_cards, n)
         return selected if n > 1 else selected[0]
 
+    @cached_property
+    def int_value(self) -> int:
+        """The Cactus Kev integer encoding of the card used by the hand evaluator.
+
+        It is computed on first access and kept on the instance.
+
+        .. versionadded:: 0.3.0
+        """
+        return card_to_int(self)
+
     def score(self) -> Tuple[HandType, float]:
         """Classifies and scores the card.
 
@@ -8,6 +8,9 @@ from .card import Card
 
 __all__ = ["Deck"]
 
+# Cards are frozen, so every deck is built from the same 52 instances
+_STANDARD_CARDS = tuple(Card(suit=suit, rank=rank) for rank in Rank for suit in Suit)
+
 
 class Deck(BaseModel):
     """A standard deck of 52 playing cards.
@@ -39,16 +42,7 @@ class Deck(BaseModel):
         shuffle : bool, optional
             Whether to shuffle the deck after building (default is False).
         """
-        ranks = list(Rank)
-        suits = list(Suit)
-        cards = []
-
-        for rank in ranks:
-            for suit in suits:
-                card = Card(suit=suit, rank=rank)
-                cards.append(card)
-
-        deck = cls(cards=cards)
+        deck = cls.model_construct(cards=list(_STANDARD_CARDS))
 
         if shuffle:
             deck.shuffle()
@@ -101,10 +95,14 @@ class Deck(BaseModel):
             )
             return []
 
-        dealt_cards = random.sample(self.cards, n)
+        # sampling positions draws the same cards as sampling the cards themselves,
+        # but lets us delete by index instead of searching by equality
+        cards = self.cards
+        indices = random.sample(range(len(cards)), n)
+        dealt_cards = [cards[i] for i in indices]
 
-        for card in dealt_cards:
-            self.cards.remove(card)
+        for i in sorted(indices, reverse=True):
+            del cards[i]
 
         return dealt_cards
 
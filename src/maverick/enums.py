@@ -365,3 +365,71 @@ class GameEventType(Enum):
     ANTES_POSTED = auto()
     BETTING_ROUND_STARTED = auto()
     BETTING_ROUND_COMPLETED = auto()
+
+
+# Export the members of the enums whose member names do not clash with each other
+# at module level, so that callers can write ``from maverick.enums import FLUSH``
+# and compare against a plain global instead of a qualified attribute lookup.
+# ``enum.global_enum`` is not used since it would also change the ``repr`` of the
+# members, and the remaining enums share member names (e.g. ``ALL_IN``, ``FLOP``).
+# The aliases are written out so that static tools can resolve them.
+
+HEARTS = Suit.HEARTS
+SPADES = Suit.SPADES
+CLUBS = Suit.CLUBS
+DIAMONDS = Suit.DIAMONDS
+
+TWO = Rank.TWO
+THREE = Rank.THREE
+FOUR = Rank.FOUR
+FIVE = Rank.FIVE
+SIX = Rank.SIX
+SEVEN = Rank.SEVEN
+EIGHT = Rank.EIGHT
+NINE = Rank.NINE
+TEN = Rank.TEN
+JACK = Rank.JACK
+QUEEN = Rank.QUEEN
+KING = Rank.KING
+ACE = Rank.ACE
+
+HIGH_CARD = HandType.HIGH_CARD
+PAIR = HandType.PAIR
+TWO_PAIR = HandType.TWO_PAIR
+THREE_OF_A_KIND = HandType.THREE_OF_A_KIND
+STRAIGHT = HandType.STRAIGHT
+FLUSH = HandType.FLUSH
+FULL_HOUSE = HandType.FULL_HOUSE
+FOUR_OF_A_KIND = HandType.FOUR_OF_A_KIND
+STRAIGHT_FLUSH = HandType.STRAIGHT_FLUSH
+ROYAL_FLUSH = HandType.ROYAL_FLUSH
+
+__all__ += [
+    "HEARTS",
+    "SPADES",
+    "CLUBS",
+    "DIAMONDS",
+    "TWO",
+    "THREE",
+    "FOUR",
+    "FIVE",
+    "SIX",
+    "SEVEN",
+    "EIGHT",
+    "NINE",
+    "TEN",
+    "JACK",
+    "QUEEN",
+    "KING",
+    "ACE",
+    "HIGH_CARD",
+    "PAIR",
+    "TWO_PAIR",
+    "THREE_OF_A_KIND",
+    "STRAIGHT",
+    "FLUSH",
+    "FULL_HOUSE",
+    "FOUR_OF_A_KIND",
+    "STRAIGHT_FLUSH",
+    "ROYAL_FLUSH",
+]
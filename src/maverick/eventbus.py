@@ -47,6 +47,8 @@ class EventBus:
     def __init__(self, *, strict: bool = False):
         self._subs: list[Subscription] = []
         self._strict = strict
+        # the number of subscriptions by event type, kept up to date on every change
+        self._counts: dict[GameEventType, int] = {}
 
     def subscribe(
         self,
@@ -85,11 +87,25 @@ class EventBus:
         )
         # higher priority first
         self._subs.sort(key=lambda s: s.priority, reverse=True)
+        self._counts[event_type] = self._counts.get(event_type, 0) + 1
         return token
 
     def unsubscribe(self, token: str) -> None:
         """Unsubscribe a handler using its token."""
-        self._subs = [s for s in self._subs if s.token != token]
+        subs = []
+        for s in self._subs:
+            if s.token == token:
+                self._counts[s.event_type] -= 1
+            else:
+                subs.append(s)
+        self._subs = subs
+
+    def has_subscribers(self, event_type: GameEventType) -> bool:
+        """Return True if a handler is subscribed to the event type.
+
+        .. versionadded:: 0.3.0
+        """
+        return self._counts.get(event_type, 0) > 0
 
     def emit(self, event: "GameEvent", game: "Game") -> None:
         """Emit an event to all subscribed handlers."""
@@ -3,12 +3,15 @@ Game event model for the synchronous event dispatch system.
 
 This module defines an immutable GameEvent payload that represents
 a snapshot of what happened in the game at a specific point in time.
+Events are frozen dataclasses, which are much cheaper to create than
+pydantic models, with the pydantic methods to dump and validate them.
 """
 
-from typing import Optional, Any
+from dataclasses import dataclass, field
+from typing import Optional, Any, Literal
 import time, uuid
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import ConfigDict, TypeAdapter
 
 from .enums import GameEventType, Street, GameStage
 from .playeraction import PlayerAction
@@ -16,7 +19,8 @@ from .playeraction import PlayerAction
 __all__ = ["GameEvent"]
 
 
-class GameEvent(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class GameEvent:
     """
     Immutable game event payload.
 
@@ -50,10 +54,18 @@ class GameEvent(BaseModel):
         The action taken by the player, if applicable.
     payload : dict[str, Any]
         Additional event-specific data.
+
+    .. versionchanged:: 0.3.0
+        A frozen dataclass with slots instead of a pydantic model. Events are
+        created on every step of the game, so only the event type is validated on
+        creation. :meth:`model_validate` validates every field, and
+        :meth:`model_dump` and :meth:`model_dump_json` serialize events as before.
     """
 
-    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
-    ts: float = Field(default_factory=time.time)
+    __pydantic_config__ = ConfigDict(extra="forbid")
+
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    ts: float = field(default_factory=time.time)
     type: GameEventType
 
     hand_number: int
@@ -63,10 +75,24 @@ class GameEvent(BaseModel):
     player_id: Optional[str] = None
     action: Optional[PlayerAction] = None
 
-    payload: dict[str, Any] = Field(default_factory=dict)
+    payload: dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if self.type.__class__ is not GameEventType:
+            object.__setattr__(self, "type", GameEventType(self.type))
+
+    @classmethod
+    def model_validate(cls, obj: Any) -> "GameEvent":
+        """Validate a dictionary of fields and return the event."""
+        return _ADAPTER.validate_python(obj)
+
+    def model_dump(self, *, mode: Literal["python", "json"] = "python") -> dict:
+        """Return the fields of the event as a dictionary."""
+        return _ADAPTER.dump_python(self, mode=mode)
+
+    def model_dump_json(self) -> str:
+        """Return the fields of the event as a JSON string."""
+        return _ADAPTER.dump_json(self).decode()
+
 
-    model_config = ConfigDict(
-        frozen=True,  # Makes the model immutable
-        extra="forbid",  # Prevents accidental fields
-        arbitrary_types_allowed=True,
-    )
+_ADAPTER = TypeAdapter(GameEvent)
@@ -8,8 +8,12 @@ pot distribution.
 
 from __future__ import annotations
 
-from typing import Deque, Optional
+from typing import Callable, Deque, Optional
 from collections import deque
+from concurrent.futures import Executor
+import copy
+from operator import itemgetter
+import asyncio
 import logging
 from warnings import warn
 
@@ -28,13 +32,57 @@ from .protocol import PlayerLike, EventHandler
 from .state import GameState
 from .playeraction import PlayerAction
 from .playerstate import PlayerState
-from .utils import find_highest_scoring_hand
+from .utils import best_hands, hand_type_from_rank, score_from_rank
 from .eventbus import EventBus
 from .rules import PokerRules, DealingRules, StakesRules, ShowdownRules
 from .table import Table
 
 __all__ = ["Game"]
 
+_FOLD = ActionType.FOLD.value
+_CHECK = ActionType.CHECK.value
+_CALL = ActionType.CALL.value
+_BET = ActionType.BET.value
+_RAISE = ActionType.RAISE.value
+_ALL_IN = ActionType.ALL_IN.value
+_FOLD_BIT = 1 << _FOLD
+
+_STATE_ACTIVE = PlayerStateType.ACTIVE
+_STATE_FOLDED = PlayerStateType.FOLDED
+_STATE_ALL_IN = PlayerStateType.ALL_IN
+
+# ANSI colors (set NO_COLOR=1 to disable)
+_STAGE_COLORS = {
+    GameStage.PRE_FLOP: "\033[38;5;39m",  # blue
+    GameStage.FLOP: "\033[38;5;34m",  # green
+    GameStage.TURN: "\033[38;5;214m",  # orange
+    GameStage.RIVER: "\033[38;5;196m",  # red
+    GameStage.SHOWDOWN: "\033[38;5;201m",  # magenta
+}
+
+# The colored stage name that prefixes log messages, built once for every stage
+_STAGE_PREFIX = {
+    stage: f"{_STAGE_COLORS.get(stage, '')}{stage.name}\033[0m" for stage in GameStage
+}
+
+# The valid actions for every possible bitmask, in the order of the enumeration
+_ACTIONS_BY_BITS = tuple(
+    tuple(a for a in ActionType if bits >> a.value & 1)
+    for bits in range(1 << (max(a.value for a in ActionType) + 1))
+)
+
+# The stage, street, event and number of cards dealt after each betting street
+_NEXT_STREET = {
+    GameStage.PRE_FLOP: (GameStage.FLOP, Street.FLOP, GameEventType.FLOP_DEALT, 3),
+    GameStage.FLOP: (GameStage.TURN, Street.TURN, GameEventType.TURN_DEALT, 1),
+    GameStage.TURN: (GameStage.RIVER, Street.RIVER, GameEventType.RIVER_DEALT, 1),
+}
+
+# The name of the player hook called for every event type
+_HOOK_NAMES = {
+    event_type: f"on_{event_type.name.lower()}" for event_type in GameEventType
+}
+
 
 class Game:
     """
@@ -70,6 +118,27 @@ class Game:
     first_button_position : int | None
         The seat index of the player who will be the button in the first hand. If None (the default), the
         button is assigned randomly using a card draw.
+    buffer_logs : bool
+        If True, informational and debug log messages are collected during a hand and written as a
+        single log record when the hand ends, which is considerably cheaper when simulating many hands.
+        The record has the highest level of the messages it contains. Warnings, errors and messages
+        with extra logging arguments are written immediately, after the messages collected before
+        them. Defaults to False, which writes every message as soon as it is
+        produced, as needed for interactive play.
+
+        .. versionadded:: 0.3.0
+    history_size : int | None
+        The maximum number of events kept in the history, older events are discarded
+        as new ones are emitted. 0 disables the history. If None (the default), every
+        event of the game is kept, which grows without bound over long simulations.
+
+        Without a history, an event is only created if a handler is subscribed to
+        its type or a player observes events. Players observe every event through
+        their hooks, unless they opt out with an ``observes_events`` attribute set
+        to False, see :attr:`Player.observes_events`. The attribute is read when a
+        player joins or leaves the game and when a hand starts.
+
+        .. versionadded:: 0.3.0
     """
 
     def __init__(
@@ -85,6 +154,8 @@ class Game:
         log_events: bool = True,
         rules: Optional[PokerRules] = None,
         first_button_position: Optional[int] = None,
+        buffer_logs: bool = False,
+        history_size: Optional[int] = None,
     ):
         if not exc_handling_mode in ["log", "raise"]:
             raise ValueError("exc_handling_mode must be 'log' or 'raise'")
@@ -121,6 +192,9 @@ class Game:
             if not first_button_position >= 0:
                 raise ValueError("first_button_position must be non-negative")
 
+        if history_size is not None and history_size < 0:
+            raise ValueError("history_size must be non-negative")
+
         self._rules = rules
         self._max_hands = max_hands
         self._state = GameState(
@@ -131,16 +205,33 @@ class Game:
         self._event_queue: Deque[GameEventType] = deque()
         self._logger = logging.getLogger("maverick")
         self._log_events = log_events
+        self._buffer_logs = buffer_logs
+        self._log_buffer: list[str] = []
+        self._log_buffer_level = logging.NOTSET
         self._first_button_position = first_button_position
+        self._seat_order: tuple[int, ...] = ()
+        self._next_seat: list[Optional[int]] = []
         self._all_stacks_at_game_start = 0
+        # the position of every player of the game in the player list by id, without
+        # the eliminated players who are still seated at the table
+        self._player_index: dict[str, int] = {}
 
         # Event handling
         self._events = EventBus(strict=exc_handling_mode == "raise")
-        self._event_history: list[GameEvent] = []
+        self._event_history: list[GameEvent] | Deque[GameEvent]
+        if history_size is None:
+            self._event_history = []
+        else:
+            self._event_history = deque(maxlen=history_size)
+        # without a history, events are only created if someone observes them
+        self._record_events = history_size != 0
+        self._players_observe_events = False
 
         # Table
         self._table = Table(n_seats=rules.dealing.max_players)
 
+        self._build_dispatch_tables()
+
     @property
     def rules(self) -> PokerRules:
         """Returns the poker rules used in this game."""
@@ -158,9 +249,11 @@ class Game:
         Returns
         -------
         list[GameEvent]
-            A list of all game events in chronological order.
+            A list of all game events in chronological order. If the size of the
+            history is limited, only the most recent events.
         """
-        return self._event_history
+        history = self._event_history
+        return history if isinstance(history, list) else list(history)
 
     @property
     def table(self) -> Table:
@@ -172,7 +265,7 @@ class Game:
 
     def _log(
         self,
-        message: str,
+        message: str | Callable[[], str],
         loglevel: int = logging.INFO,
         stage_prefix: bool = True,
         **kwargs,
@@ -180,22 +273,33 @@ class Game:
         if not self._log_events:  # pragma: no cover
             return
 
-        # ANSI colors (set NO_COLOR=1 to disable)
-        color_map = {
-            GameStage.PRE_FLOP: "\033[38;5;39m",  # blue
-            GameStage.FLOP: "\033[38;5;34m",  # green
-            GameStage.TURN: "\033[38;5;214m",  # orange
-            GameStage.RIVER: "\033[38;5;196m",  # red
-            GameStage.SHOWDOWN: "\033[38;5;201m",  # magenta
-        }
-        reset = "\033[0m"
+        if not self._logger.isEnabledFor(loglevel):
+            return
+
+        # hot call sites pass a callable, only formatted if the message is logged
+        if callable(message):
+            message = message()
+
+        if stage_prefix:
+            message = f"{_STAGE_PREFIX[self.state.stage]} | {message}"
+
+        if self._buffer_logs:
+            if loglevel <= logging.INFO and not kwargs:
+                self._log_buffer.append(message)
+                if loglevel > self._log_buffer_level:
+                    self._log_buffer_level = loglevel
+                return
+            # keep the order of messages, everything buffered so far comes first
+            self._flush_logs()
 
-        stage = self.state.stage
-        stage_name = stage.name
-        stage_prefix_msg = f"{color_map.get(stage, '')}{stage_name}{reset}"
+        self._logger.log(loglevel, message, **kwargs)
 
-        msg = f"{stage_prefix_msg} | {message}" if stage_prefix else message
-        self._logger.log(loglevel, msg, **kwargs)
+    def _flush_logs(self) -> None:
+        """Write the buffered log messages as a single record."""
+        if self._log_buffer:
+            self._logger.log(self._log_buffer_level, "\n".join(self._log_buffer))
+            self._log_buffer.clear()
+            self._log_buffer_level = logging.NOTSET
 
     def subscribe(
         self, event_type: GameEventType, handler: EventHandler, **kwargs
@@ -244,6 +348,8 @@ class Game:
 
         # player hooks
         for p in self.state.players:
+            if not getattr(p, "observes_events", True):
+                continue
             fn = getattr(p, "on_event", None)
             if callable(fn):
                 try:
@@ -253,7 +359,7 @@ class Game:
                         f"Exception in player {p.name} on_event hook for {event.type.name}",
                         exc_info=True,
                     )
-            specific = getattr(p, f"on_{event.type.name.lower()}", None)
+            specific = getattr(p, _HOOK_NAMES[event.type], None)
             if callable(specific):
                 try:
                     specific(event, self)
@@ -263,11 +369,35 @@ class Game:
                         exc_info=True,
                     )
 
+    def _update_observed_events(self) -> None:
+        """Check if any of the players observes the events of the game."""
+        self._players_observe_events = any(
+            getattr(p, "observes_events", True) for p in self.state.players
+        )
+
+    def _emit_event(
+        self,
+        event_type: GameEventType,
+        player_id: Optional[str] = None,
+        action: Optional[PlayerAction] = None,
+        payload: Optional[dict] = None,
+    ) -> None:
+        """
+        Create and emit an event, unless nobody would record or observe it. The
+        parameters are those of :meth:`_create_event`.
+        """
+        if (
+            self._record_events
+            or self._players_observe_events
+            or self._events.has_subscribers(event_type)
+        ):
+            self._emit(self._create_event(event_type, player_id, action, payload))
+
     def _create_event(
         self,
         event_type: GameEventType,
         player_id: Optional[str] = None,
-        action: Optional[ActionType] = None,
+        action: Optional[PlayerAction] = None,
         payload: Optional[dict] = None,
     ) -> GameEvent:
         """
@@ -279,8 +409,10 @@ class Game:
             The type of event.
         player_id : Optional[str]
             ID of the player involved in the event.
-        action : Optional[ActionType]
-            Type of action taken (for PLAYER_ACTION events).
+        action : Optional[PlayerAction]
+            The action taken (for PLAYER_ACTION_TAKEN events).
+        payload : Optional[dict]
+            Additional data of the event.
 
         Returns
         -------
@@ -314,13 +446,14 @@ class Game:
         ]:
             raise ValueError("Cannot add players while game is in progress")
 
-        existing_names = set([p.name for p in self.state.players])
-        if player.name in existing_names:
-            raise ValueError(f"Player name '{player.name}' is already taken")
+        name = player.name
+        if any(p.name == name for p in self.state.players):
+            raise ValueError(f"Player name '{name}' is already taken")
 
-        existing_ids = set([p.id for p in self.state.players])
-        if player.id in existing_ids:
-            raise ValueError(f"Player id '{player.id}' is already taken")
+        # eliminated players stay seated, the table index is not the player list
+        player_id = player.id
+        if self._find_player(player_id) is not None:
+            raise ValueError(f"Player id '{player_id}' is already taken")
 
         if player.state is None:
             player.state = PlayerState(state_type=PlayerStateType.ACTIVE)
@@ -329,10 +462,12 @@ class Game:
             self.table.seat_player(player, seat_index=player.state.seat)
         player.state.state_type = PlayerStateType.ACTIVE
 
+        self._player_index[player_id] = len(self.state.players)
         self.state.players.append(player)
+        self._update_observed_events()
 
         self._handle_event(GameEventType.PLAYER_JOINED)
-        self._emit(self._create_event(GameEventType.PLAYER_JOINED, player_id=player.id))
+        self._emit_event(GameEventType.PLAYER_JOINED, player_id=player.id)
         self._log(
             f"Player {player.name} joined the game.", logging.INFO, stage_prefix=False
         )
@@ -355,25 +490,209 @@ class Game:
         ]:
             raise ValueError("Cannot remove players while hand is in progress")
 
-        player = next((p for p in self.state.players if p.id == player_id), None)
-        if not player:
+        # eliminated players stay seated, only the players of the game can leave
+        i = self._find_player(player_id)
+        if i is None:
             raise ValueError(f"Player with id {player_id} not found")
+        players = self.state.players
+        player = players[i]
 
         self.table.remove_player(player)
-        self.state.players = [p for p in self.state.players if p.id != player_id]
+        del players[i]
+        self._reindex_players()
+        self._update_observed_events()
 
         self._handle_event(GameEventType.PLAYER_LEFT)
-        self._emit(self._create_event(GameEventType.PLAYER_LEFT, player_id=player_id))
+        self._emit_event(GameEventType.PLAYER_LEFT, player_id=player_id)
         self._log(
             f"Player {player.name} left the game.", logging.INFO, stage_prefix=False
         )
 
+    def _reindex_players(self) -> dict[str, int]:
+        """Rebuild the index of the players of the game by id and return it."""
+        self._player_index = {p.id: i for i, p in enumerate(self.state.players)}
+        return self._player_index
+
+    def _find_player(self, player_id: str) -> Optional[int]:
+        """
+        Return the position of a player of the game in the player list, or None if
+        there is no player with the id. The index is rebuilt if the player list was
+        changed outside of the game.
+        """
+        players = self.state.players
+        index = self._player_index
+        if len(index) != len(players):
+            index = self._reindex_players()
+        i = index.get(player_id)
+        if i is not None and players[i].id != player_id:
+            i = self._reindex_players().get(player_id)
+        return i
+
     def start(self) -> None:
         """Start the poker game."""
         self._log("Game started.\n", logging.INFO, stage_prefix=False)
-        self._initialize_game()
-        self._event_queue.append(GameEventType.GAME_STARTED)
-        self._drain_event_queue()
+        try:
+            self._initialize_game()
+            self._drain_event_queue(GameEventType.GAME_STARTED)
+        finally:
+            # write the buffered messages also if a player or a handler raised
+            self._flush_logs()
+
+    async def astart(self, executor: Optional[Executor] = None) -> None:
+        """Start the poker game without blocking the running event loop.
+
+        The game is played in a worker thread, so that independent games can run
+        concurrently, e.g. with ``asyncio.gather``, while their players wait for
+        I/O such as a remote service. Games sharing the global random number
+        generator are not reproducible when run concurrently.
+
+        Without an executor, the game runs in the default executor of the event
+        loop, which has ``min(32, os.cpu_count() + 4)`` threads. More games than
+        that wait for a free thread, pass a larger thread pool to run them all at
+        once.
+
+        The players, their hooks and the subscribed handlers are called from the
+        worker thread, with the same synchronous ``decide_action`` as in
+        :meth:`start`. They must not touch objects bound to the event loop, such as
+        futures, tasks or ``asyncio.Queue`` instances, other than through
+        thread-safe calls like ``loop.call_soon_threadsafe``.
+
+        Parameters
+        ----------
+        executor : concurrent.futures.Executor, optional
+            The executor to play the game in. It must run the game in a thread of
+            this process, e.g. a ``ThreadPoolExecutor``.
+
+        .. versionadded:: 0.3.0
+        """
+        if executor is None:
+            await asyncio.to_thread(self.start)
+        else:
+            await asyncio.get_running_loop().run_in_executor(executor, self.start)
+
+    def clone(self) -> "Game":
+        """Return a copy of the game that can be played on independently.
+
+        The copy has its own state, table, deck and players, so that playing it out,
+        e.g. to explore the outcome of an action in a search, leaves this game
+        untouched. The players are shallow copies of the original ones with a copy of
+        their state and holding. The copy does not inherit the event subscriptions
+        and starts with an empty history. The rules are shared.
+
+        .. versionadded:: 0.3.0
+        """
+        clones: dict[str, PlayerLike] = {}
+        for player in self.state.players + [p for p in self.table.seats if p]:
+            if player.id not in clones:
+                pstate = player.state
+                holding = pstate.holding
+                clone = copy.copy(player)
+                clone.state = pstate.model_copy(
+                    update={
+                        "holding": (
+                            None
+                            if holding is None
+                            else holding.model_copy(
+                                update={"cards": list(holding.cards)}
+                            )
+                        )
+                    }
+                )
+                clones[player.id] = clone
+
+        state = self.state
+        deck = state.deck
+        history = self._event_history
+
+        # every attribute set in __init__ is copied explicitly, nothing is shared
+        # with this game by accident
+        game = type(self).__new__(type(self))
+        game._rules = self._rules
+        game._max_hands = self._max_hands
+        game._state = state.model_copy(
+            update={
+                "players": [clones[p.id] for p in state.players],
+                "community_cards": list(state.community_cards),
+                "deck": (
+                    None
+                    if deck is None
+                    else deck.model_copy(update={"cards": list(deck.cards)})
+                ),
+            }
+        )
+        game._event_queue = deque(self._event_queue)
+        game._logger = self._logger
+        game._log_events = self._log_events
+        game._buffer_logs = self._buffer_logs
+        game._log_buffer = list(self._log_buffer)
+        game._log_buffer_level = self._log_buffer_level
+        game._first_button_position = self._first_button_position
+        game._seat_order = self._seat_order
+        game._next_seat = list(self._next_seat)
+        game._all_stacks_at_game_start = self._all_stacks_at_game_start
+        game._player_index = dict(self._player_index)
+        game._events = EventBus(strict=self._events._strict)
+        game._event_history = (
+            [] if isinstance(history, list) else deque(maxlen=history.maxlen)
+        )
+        game._record_events = self._record_events
+        game._players_observe_events = self._players_observe_events
+        game._table = self.table.clone(clones)
+
+        # the handlers are bound to the game they were created for
+        game._build_dispatch_tables()
+        game._bind_hand_specializations()
+        return game
+
+    def _build_dispatch_tables(self) -> None:
+        """Build the tables dispatching events and actions to the bound handlers."""
+        # Event dispatch table, built once instead of pattern matching every event.
+        # It is a list indexed by the value of the event type, which is cheaper than
+        # hashing the enum member (Enum.__hash__ is implemented in Python).
+        handlers: dict[GameEventType, Callable[[], Optional[GameEventType]]] = {
+            GameEventType.GAME_STARTED: self._on_game_started,
+            GameEventType.HAND_STARTED: self._on_hand_started,
+            GameEventType.HOLE_CARDS_DEALT: self._on_hole_cards_dealt,
+            GameEventType.BLINDS_POSTED: self._on_blinds_posted,
+            GameEventType.ANTES_POSTED: self._on_antes_posted,
+            GameEventType.PLAYER_ACTION_TAKEN: self._on_player_action_taken,
+            GameEventType.BETTING_ROUND_COMPLETED: self._on_betting_round_completed,
+            GameEventType.FLOP_DEALT: self._on_street_dealt,
+            GameEventType.TURN_DEALT: self._on_street_dealt,
+            GameEventType.RIVER_DEALT: self._on_street_dealt,
+            GameEventType.SHOWDOWN_COMPLETED: self._on_showdown_completed,
+            GameEventType.HAND_ENDED: self._on_hand_ended,
+            GameEventType.GAME_ENDED: self._on_game_ended,
+            GameEventType.PLAYER_JOINED: self._on_player_joined,
+            GameEventType.PLAYER_LEFT: self._on_player_left,
+            GameEventType.PLAYER_ELIMINATED: self._on_player_eliminated,
+        }
+        size = max(e.value for e in GameEventType) + 1
+        self._dispatch: list[Optional[Callable[[], Optional[GameEventType]]]]
+        self._dispatch = [None] * size
+        for event_type, handler in handlers.items():
+            self._dispatch[event_type.value] = handler
+
+        # Draining the queue does not expose single events, there a betting round
+        # is played out in one call instead of one dispatch per action
+        self._drain_dispatch = list(self._dispatch)
+        self._drain_dispatch[GameEventType.PLAYER_ACTION_TAKEN.value] = (
+            self._play_out_betting_round
+        )
+
+        # Handlers applying the effect of an action, indexed by the action value
+        appliers: dict[ActionType, Callable[[PlayerLike, int], None]] = {
+            ActionType.FOLD: self._apply_fold,
+            ActionType.CHECK: self._apply_check,
+            ActionType.CALL: self._apply_call,
+            ActionType.BET: self._apply_bet,
+            ActionType.RAISE: self._apply_raise,
+            ActionType.ALL_IN: self._apply_all_in,
+        }
+        self._action_handlers: list[Optional[Callable[[PlayerLike, int], None]]]
+        self._action_handlers = [None] * (max(a.value for a in ActionType) + 1)
+        for action_type, applier in appliers.items():
+            self._action_handlers[action_type.value] = applier
 
     def _find_first_button_position(self) -> int:
         """Determine the button position (seat index) for the first hand."""
@@ -410,207 +729,225 @@ class Game:
         return idx
 
     def _handle_event(self, event: GameEventType) -> None:
-        match event:
-            case GameEventType.GAME_STARTED:
-                assert self.state.stage == GameStage.READY
-                self.state.stage = GameStage.STARTED
-                self._emit(self._create_event(GameEventType.GAME_STARTED))
-                self._start_new_hand()
-                self._event_queue.append(GameEventType.HAND_STARTED)
-
-            case GameEventType.HAND_STARTED:
-                assert self.state.stage in [
-                    GameStage.STARTED,
-                    GameStage.HAND_COMPLETE,
-                ]
-                self.state.stage = GameStage.DEALING
-                self._emit(self._create_event(GameEventType.HAND_STARTED))
-                self._deal_hole_cards()
-                self._emit(self._create_event(GameEventType.HOLE_CARDS_DEALT))
-                self._event_queue.append(GameEventType.HOLE_CARDS_DEALT)
-
-            case GameEventType.HOLE_CARDS_DEALT:
-                assert self.state.stage == GameStage.DEALING
-                self._post_blinds()
-                self._emit(self._create_event(GameEventType.BLINDS_POSTED))
-                self._event_queue.append(GameEventType.BLINDS_POSTED)
-
-            case GameEventType.BLINDS_POSTED:
-                assert self.state.stage == GameStage.DEALING
-                self._post_antes()
-                self._emit(self._create_event(GameEventType.ANTES_POSTED))
-                self._event_queue.append(GameEventType.ANTES_POSTED)
-
-            case GameEventType.ANTES_POSTED:
-                assert self.state.stage == GameStage.DEALING
-                self.state.stage = GameStage.PRE_FLOP
-                self._emit(self._create_event(GameEventType.BETTING_ROUND_STARTED))
-                self._take_action_from_current_player()
-                self._event_queue.append(GameEventType.PLAYER_ACTION_TAKEN)
-
-            case GameEventType.PLAYER_ACTION_TAKEN:
-                if self.state.is_betting_round_complete():
-                    self._complete_betting_round()
-                    self._emit(
-                        self._create_event(GameEventType.BETTING_ROUND_COMPLETED)
-                    )
-                    self._event_queue.append(GameEventType.BETTING_ROUND_COMPLETED)
-                else:
-                    self._advance_to_next_player()
-                    self._take_action_from_current_player()
-                    self._event_queue.append(GameEventType.PLAYER_ACTION_TAKEN)
-
-            case GameEventType.BETTING_ROUND_COMPLETED:
-                if len(self.state.get_players_in_hand()) == 1:
-                    self.state.stage = GameStage.SHOWDOWN
-                    self.state.street = None
-                    self._emit(self._create_event(GameEventType.SHOWDOWN_STARTED))
-                    self._handle_showdown()
-                    self._emit(self._create_event(GameEventType.SHOWDOWN_COMPLETED))
-                    self._event_queue.append(GameEventType.SHOWDOWN_COMPLETED)
-                else:
-                    if self.state.stage == GameStage.PRE_FLOP:
-                        self.state.stage = GameStage.FLOP
-                        self.state.street = Street.FLOP
-                        self._deal_flop()
-                        self._emit(self._create_event(GameEventType.FLOP_DEALT))
-                        self._event_queue.append(GameEventType.FLOP_DEALT)
-                        self._advance_to_first_active_player()
-                    elif self.state.stage == GameStage.FLOP:
-                        self.state.stage = GameStage.TURN
-                        self.state.street = Street.TURN
-                        self._deal_turn()
-                        self._emit(self._create_event(GameEventType.TURN_DEALT))
-                        self._event_queue.append(GameEventType.TURN_DEALT)
-                        self._advance_to_first_active_player()
-                    elif self.state.stage == GameStage.TURN:
-                        self.state.stage = GameStage.RIVER
-                        self.state.street = Street.RIVER
-                        self._deal_river()
-                        self._emit(self._create_event(GameEventType.RIVER_DEALT))
-                        self._event_queue.append(GameEventType.RIVER_DEALT)
-                        self._advance_to_first_active_player()
-                    elif self.state.stage == GameStage.RIVER:
-                        self.state.stage = GameStage.SHOWDOWN
-                        self.state.street = None
-                        self._emit(self._create_event(GameEventType.SHOWDOWN_STARTED))
-                        self._handle_showdown()
-                        self._emit(self._create_event(GameEventType.SHOWDOWN_COMPLETED))
-                        self._event_queue.append(GameEventType.SHOWDOWN_COMPLETED)
-
-            case (
-                GameEventType.FLOP_DEALT
-                | GameEventType.TURN_DEALT
-                | GameEventType.RIVER_DEALT
-            ):
-                self._emit(self._create_event(GameEventType.BETTING_ROUND_STARTED))
-                if self.state.is_betting_round_complete():
-                    self._complete_betting_round()
-                    self._emit(
-                        self._create_event(GameEventType.BETTING_ROUND_COMPLETED)
-                    )
-                    self._event_queue.append(GameEventType.BETTING_ROUND_COMPLETED)
-                    self._log(
-                        "There are not active players at the table.",
-                        logging.INFO,
-                    )
-                else:
-                    self._take_action_from_current_player()
-                    self._event_queue.append(GameEventType.PLAYER_ACTION_TAKEN)
-
-            case GameEventType.SHOWDOWN_COMPLETED:
-                self.state.stage = GameStage.HAND_COMPLETE
-                self._emit(self._create_event(GameEventType.HAND_ENDED))
-                self._event_queue.append(GameEventType.HAND_ENDED)
-
-            case GameEventType.HAND_ENDED:
-                self._log("Hand ended\n", logging.INFO, stage_prefix=False)
-
-                # eliminate players with zero stack
-                eliminated_players = [
-                    p for p in self.state.players if p.state.stack == 0
-                ]
-                for player in eliminated_players:
-                    self._emit(
-                        self._create_event(
-                            GameEventType.PLAYER_ELIMINATED, player_id=player.id
-                        )
-                    )
-                    self._log(
-                        f"Player {player.name} has been eliminated from the game.",
-                        logging.INFO,
-                        stage_prefix=False,
-                    )
-                    self._event_queue.append(GameEventType.PLAYER_ELIMINATED)
-
-                # Remove eliminated players from the game
-                self.state.players = [
-                    p for p in self.state.players if p.state.stack > 0
-                ]
-
-                # remove eliminated players from the table
-                for player in eliminated_players:
-                    self._emit(
-                        self._create_event(
-                            GameEventType.PLAYER_LEFT, player_id=player.id
-                        )
-                    )
-                    self._log(
-                        f"Player {player.name} has left the table.",
-                        logging.INFO,
-                        stage_prefix=False,
-                    )
-                    self._event_queue.append(GameEventType.PLAYER_LEFT)
-
-                if len(self.state.players) < self.rules.dealing.min_players:
-                    self._log(
-                        "Not enough players to continue, ending game.", logging.INFO
-                    )
-                    self.state.stage = GameStage.GAME_OVER
-                    self._event_queue.append(GameEventType.GAME_ENDED)
-                else:
-                    self._move_button()
-
-                    if self.state.hand_number >= self._max_hands:
-                        self._log(
-                            "Reached maximum number of hands, ending game.",
-                            logging.INFO,
-                            stage_prefix=False,
-                        )
-                        self.state.stage = GameStage.GAME_OVER
-                        self._event_queue.append(GameEventType.GAME_ENDED)
-                    else:
-                        self._start_new_hand()
-                        self._event_queue.append(GameEventType.HAND_STARTED)
-
-            case GameEventType.GAME_ENDED:
-                self._log("Game ended", logging.INFO, stage_prefix=False)
-                self._emit(self._create_event(GameEventType.GAME_ENDED))
-
-            case GameEventType.PLAYER_JOINED:
-                if self.state.stage == GameStage.WAITING_FOR_PLAYERS:
-                    if len(self.state.players) >= self.rules.dealing.min_players:
-                        self.state.stage = GameStage.READY
-
-            case GameEventType.PLAYER_LEFT:
-                if len(self.state.players) < self.rules.dealing.min_players:
-                    self.state.stage = GameStage.WAITING_FOR_PLAYERS
+        handler = self._dispatch[event._value_]
+        if handler is None:  # pragma: no cover
+            raise ValueError(f"Unknown event: {event}")
+        next_event = handler()
+        if next_event is not None:
+            self._event_queue.append(next_event)
+
+    def _on_game_started(self) -> Optional[GameEventType]:
+        assert self.state.stage == GameStage.READY
+        self.state.stage = GameStage.STARTED
+        self._emit_event(GameEventType.GAME_STARTED)
+        self._start_new_hand()
+        return GameEventType.HAND_STARTED
+
+    def _on_hand_started(self) -> Optional[GameEventType]:
+        assert self.state.stage in [
+            GameStage.STARTED,
+            GameStage.HAND_COMPLETE,
+        ]
+        self.state.stage = GameStage.DEALING
+        self._emit_event(GameEventType.HAND_STARTED)
+        self._deal_hole_cards()
+        self._emit_event(GameEventType.HOLE_CARDS_DEALT)
+        return GameEventType.HOLE_CARDS_DEALT
+
+    def _on_hole_cards_dealt(self) -> Optional[GameEventType]:
+        assert self.state.stage == GameStage.DEALING
+        self._post_blinds()
+        self._emit_event(GameEventType.BLINDS_POSTED)
+        return GameEventType.BLINDS_POSTED
+
+    def _on_blinds_posted(self) -> Optional[GameEventType]:
+        assert self.state.stage == GameStage.DEALING
+        self._post_antes()
+        self._emit_event(GameEventType.ANTES_POSTED)
+        return GameEventType.ANTES_POSTED
+
+    def _on_antes_posted(self) -> Optional[GameEventType]:
+        assert self.state.stage == GameStage.DEALING
+        self.state.stage = GameStage.PRE_FLOP
+        self._emit_event(GameEventType.BETTING_ROUND_STARTED)
+        self._take_action_from_current_player()
+        return GameEventType.PLAYER_ACTION_TAKEN
+
+    def _on_player_action_taken(self) -> Optional[GameEventType]:
+        if self.state.is_betting_round_complete():
+            return self._end_betting_round()
+        else:
+            self._advance_to_next_player()
+            self._take_action_from_current_player()
+            return GameEventType.PLAYER_ACTION_TAKEN
 
-            case GameEventType.PLAYER_ELIMINATED:
-                pass
+    def _play_out_betting_round(self) -> Optional[GameEventType]:
+        """
+        Equivalent to handling PLAYER_ACTION_TAKEN until the betting round is
+        complete, with the actions taken in a loop. The round is ended as soon as
+        the loop condition fails, without checking for completion a second time.
+        """
+        state = self.state
+        advance = self._advance_to_next_player
+        take_action = self._take_action_from_current_player
+        while not state.is_betting_round_complete():
+            advance()
+            take_action()
+        return self._end_betting_round()
+
+    def _end_betting_round(self) -> GameEventType:
+        self._complete_betting_round()
+        self._emit_event(GameEventType.BETTING_ROUND_COMPLETED)
+        return GameEventType.BETTING_ROUND_COMPLETED
+
+    def _on_betting_round_completed(self) -> Optional[GameEventType]:
+        if len(self.state.get_players_in_hand()) == 1:
+            self.state.stage = GameStage.SHOWDOWN
+            self.state.street = None
+            self._emit_event(GameEventType.SHOWDOWN_STARTED)
+            self._handle_showdown()
+            self._emit_event(GameEventType.SHOWDOWN_COMPLETED)
+            return GameEventType.SHOWDOWN_COMPLETED
+        else:
+            next_street = _NEXT_STREET.get(self.state.stage)
+            if next_street is not None:
+                stage, street_type, event_type, n_cards = next_street
+                self.state.stage = stage
+                self.state.street = street_type
+                self._deal_street(street_type, n_cards)
+                self._emit_event(event_type)
+                self._advance_to_first_active_player()
+                return event_type
+            elif self.state.stage == GameStage.RIVER:
+                self.state.stage = GameStage.SHOWDOWN
+                self.state.street = None
+                self._emit_event(GameEventType.SHOWDOWN_STARTED)
+                self._handle_showdown()
+                self._emit_event(GameEventType.SHOWDOWN_COMPLETED)
+                return GameEventType.SHOWDOWN_COMPLETED
+        return None
+
+    def _on_street_dealt(self) -> Optional[GameEventType]:
+        self._emit_event(GameEventType.BETTING_ROUND_STARTED)
+        if self.state.is_betting_round_complete():
+            next_event = self._end_betting_round()
+            self._log(
+                "There are not active players at the table.",
+                logging.INFO,
+            )
+            return next_event
+        else:
+            self._take_action_from_current_player()
+            return GameEventType.PLAYER_ACTION_TAKEN
+
+    def _on_showdown_completed(self) -> Optional[GameEventType]:
+        self.state.stage = GameStage.HAND_COMPLETE
+        self._emit_event(GameEventType.HAND_ENDED)
+        return GameEventType.HAND_ENDED
+
+    def _on_hand_ended(self) -> Optional[GameEventType]:
+        self._log("Hand ended\n", logging.INFO, stage_prefix=False)
+
+        # eliminate players with zero stack
+        players = self.state.players
+        eliminated_players = [p for p in players if p.state.stack == 0]
+        for player in eliminated_players:
+            self._emit_event(GameEventType.PLAYER_ELIMINATED, player_id=player.id)
+            self._log(
+                f"Player {player.name} has been eliminated from the game.",
+                logging.INFO,
+                stage_prefix=False,
+            )
+            self._event_queue.append(GameEventType.PLAYER_ELIMINATED)
+
+        # Remove eliminated players from the game, in place as it is rarely anybody
+        if eliminated_players:
+            for i in range(len(players) - 1, -1, -1):
+                if players[i].state.stack == 0:
+                    del players[i]
+            self._reindex_players()
+            self._update_observed_events()
+
+        # remove eliminated players from the table
+        for player in eliminated_players:
+            self._emit_event(GameEventType.PLAYER_LEFT, player_id=player.id)
+            self._log(
+                f"Player {player.name} has left the table.",
+                logging.INFO,
+                stage_prefix=False,
+            )
+            self._event_queue.append(GameEventType.PLAYER_LEFT)
 
-            case _:  # pragma: no cover
-                raise ValueError(f"Unknown event: {event}")
+        if len(self.state.players) < self.rules.dealing.min_players:
+            self._log("Not enough players to continue, ending game.", logging.INFO)
+            self.state.stage = GameStage.GAME_OVER
+            next_event = GameEventType.GAME_ENDED
+        else:
+            self._move_button()
 
-    def _drain_event_queue(self) -> None:
-        while self.step():
-            pass
+            if self.state.hand_number >= self._max_hands:
+                self._log(
+                    "Reached maximum number of hands, ending game.",
+                    logging.INFO,
+                    stage_prefix=False,
+                )
+                self.state.stage = GameStage.GAME_OVER
+                next_event = GameEventType.GAME_ENDED
+            else:
+                next_event = GameEventType.HAND_STARTED
+
+        # every message of the hand is written together, before the next one starts
+        self._flush_logs()
+        if next_event is GameEventType.HAND_STARTED:
+            self._start_new_hand()
+        return next_event
+
+    def _on_game_ended(self) -> None:
+        self._log("Game ended", logging.INFO, stage_prefix=False)
+        self._flush_logs()
+        self._emit_event(GameEventType.GAME_ENDED)
+
+    def _on_player_joined(self) -> None:
+        if self.state.stage == GameStage.WAITING_FOR_PLAYERS:
+            if len(self.state.players) >= self.rules.dealing.min_players:
+                self.state.stage = GameStage.READY
+
+    def _on_player_left(self) -> None:
+        if len(self.state.players) < self.rules.dealing.min_players:
+            self.state.stage = GameStage.WAITING_FOR_PLAYERS
+
+    def _on_player_eliminated(self) -> None:
+        pass
+
+    def _drain_event_queue(self, event: Optional[GameEventType] = None) -> None:
+        queue = self._event_queue
+        popleft = queue.popleft
+        dispatch = self._drain_dispatch
+        if event is not None and queue:
+            queue.append(event)
+            event = None
+        while True:
+            # Handlers return the event that follows them. As long as nothing else
+            # is waiting, it is dispatched right away instead of taking a round trip
+            # through the queue, which keeps the order of events unchanged.
+            while event is not None and not queue:
+                event = dispatch[event._value_]()
+            if event is not None:
+                queue.append(event)
+            if not queue:
+                break
+            event = dispatch[popleft()._value_]()
 
     def step(self) -> bool:
         """Process the next event in the queue."""
         if self.has_events():
             event = self._event_queue.popleft()
-            self._handle_event(event)
+            try:
+                self._handle_event(event)
+            except BaseException:
+                # the hand does not reach its end, write what was buffered so far
+                self._flush_logs()
+                raise
             return True
         return False
 
@@ -627,9 +964,10 @@ class Game:
 
     def _start_new_hand(self) -> None:
         self.state.hand_number += 1
+        self._update_observed_events()
 
         self._log(
-            "=" * 30 + f" Hand {self.state.hand_number} " + "=" * 30 + "\n",
+            lambda: "=" * 30 + f" Hand {self.state.hand_number} " + "=" * 30 + "\n",
             logging.INFO,
             stage_prefix=False,
         )
@@ -637,7 +975,9 @@ class Game:
         if len(self.state.players) < self.rules.dealing.min_players:
             raise ValueError("Not enough players to start hand")
 
-        self.state.deck = Deck.standard_deck(shuffle=True)
+        # Deck.deal draws uniformly random cards, shuffling the deck first would only
+        # spend random numbers without changing the distribution of the deals
+        self.state.deck = Deck.build()
         self.state.community_cards = []
         self.state.pot = 0
         self.state.current_bet = 0
@@ -649,9 +989,11 @@ class Game:
             player.state.acted_this_street = False
             player.state.holding = None
             if player.state.stack > 0:
-                player.state.state_type = PlayerStateType.ACTIVE
+                player.state.state_type = _STATE_ACTIVE
 
         self.state.street = Street.PRE_FLOP
+        self._compute_seat_order()
+        self._bind_hand_specializations()
 
     def get_current_player(self) -> Optional[PlayerLike]:
         """Return the player whose turn it is.
@@ -680,49 +1022,105 @@ class Game:
 
     def _take_action_from_current_player(self) -> None:
         current_player = self.get_current_player()
-
-        if (
-            not current_player
-            or current_player.state.state_type != PlayerStateType.ACTIVE
-        ):
+        if not current_player:
+            return
+        pstate = current_player.state
+        if pstate.state_type is not _STATE_ACTIVE:
             return
 
-        valid_actions = self._get_valid_actions(current_player)
+        state = self.state
+        valid_bits = self._valid_action_bits(current_player)
         min_raise_amount = self._calculate_min_raise_amount()
 
         action: PlayerAction = current_player.decide_action(
             game=self,
-            valid_actions=valid_actions,
+            valid_actions=list(_ACTIONS_BY_BITS[valid_bits]),
             min_raise_amount=min_raise_amount,
-            call_amount=self.state.current_bet - current_player.state.current_bet,
-            min_bet_amount=self.state.min_bet,
+            call_amount=state.current_bet - pstate.current_bet,
+            min_bet_amount=state.min_bet,
         )
 
+        # Reject actions of the wrong kind up front, without raising and catching
+        if (
+            not isinstance(action, PlayerAction)
+            or not valid_bits >> action.action_type._value_ & 1
+        ):
+            self._fold_after_invalid_action(current_player, action, exc_info=False)
+            return
+
+        # the turn and the validity of the action are checked above
         try:
-            self._register_player_action(current_player, action)
+            self._apply_player_action(current_player, action)
         except Exception:
-            self._log(
-                f"Player {current_player.name} intended to take action: {action}.",
-                logging.DEBUG,
-            )
-            self._log(
-                f"Player {current_player.name} action invalid, folding.",
-                logging.WARNING,
-                exc_info=True,
-            )
-            warn(f"Player {current_player.name} action invalid, folding.")
-            action = PlayerAction(
-                player_id=current_player.id, action_type=ActionType.FOLD
-            )
-            self._register_player_action(current_player, action)
+            self._fold_after_invalid_action(current_player, action, exc_info=True)
+
+    def _fold_after_invalid_action(
+        self, current_player: PlayerLike, action: PlayerAction, exc_info: bool
+    ) -> None:
+        self._log(
+            lambda: f"Player {current_player.name} intended to take action: {action}.",
+            logging.DEBUG,
+        )
+        message = f"Player {current_player.name} action invalid, folding."
+        self._log(message, logging.WARNING, exc_info=exc_info)
+        warn(message)
+        # the fields are known to be valid, skip validating them
+        action = PlayerAction.model_construct(
+            player_id=current_player.id, action_type=ActionType.FOLD
+        )
+        self._register_player_action(current_player, action)
 
     def _deal_hole_cards(self) -> None:
-        button = self.table[self.state.button_position]
+        state = self.state
+        button = self.table[state.button_position]
         self._log(f"Dealing hole cards. Button: {button.name}", logging.INFO)
-        for player in self.state.players:
-            if player.state.state_type == PlayerStateType.ACTIVE:
-                cards = self.state.deck.deal(self.rules.dealing.hole_cards)
-                player.state.holding = Holding(cards=cards)
+        deal = state.deck.deal
+        n_cards = self.rules.dealing.hole_cards
+        for player in state.players:
+            pstate = player.state
+            if pstate.state_type is _STATE_ACTIVE:
+                # the dealt cards are valid Card instances, skip revalidating them
+                pstate.holding = Holding.model_construct(cards=deal(n_cards))
+
+    def _compute_seat_order(self) -> tuple[int, ...]:
+        """
+        Compute the occupied seats in the order of action, starting left of the
+        button and ending with the button, together with the next occupied seat of
+        every seat. Seats do not change during a hand, so this is done once when a
+        hand starts instead of walking the table with modular arithmetic on every
+        action. A hand whose state was set up without starting it, e.g. in a test,
+        computes the order when it is first needed.
+        """
+        seats = self.table.seats
+        n_seats = len(seats)
+        button = self.state.button_position
+        order = tuple(
+            seat
+            for seat in [*range(button + 1, n_seats), *range(button + 1)]
+            if seats[seat] is not None
+        )
+        next_seat: list[Optional[int]] = [None] * n_seats
+        for seat, following in zip(order, order[1:] + order[:1]):
+            next_seat[seat] = following
+        self._seat_order = order
+        self._next_seat = next_seat
+        return order
+
+    def _bind_hand_specializations(self) -> None:
+        """
+        Bind the methods specialized for the table of the current hand. Heads-up,
+        the next player to act can only be the opponent or the player who just
+        acted, so specialized methods are bound on the instance for the rest of the
+        hand. Otherwise the generic methods of the class are used.
+        """
+        if len(self._seat_order) == 2 and len(self.state.players) == 2:
+            self._advance_to_next_player = self._advance_to_next_player_heads_up
+            self._reset_acted_flags_for_reopen = (
+                self._reset_acted_flags_for_reopen_heads_up
+            )
+        else:
+            vars(self).pop("_advance_to_next_player", None)
+            vars(self).pop("_reset_acted_flags_for_reopen", None)
 
     def _post_blinds(self) -> None:
         """Post blinds with correct heads-up semantics (button posts SB in HU)."""
@@ -731,49 +1129,39 @@ class Game:
         if num_players < min_num_players:
             raise ValueError(f"Need at least {min_num_players} players to post blinds")
 
-        # Heads-up special case:
-        # - Button is SMALL blind
-        # - Other player is BIG blind
+        order = self._seat_order or self._compute_seat_order()
+
+        # The blind seats and the first player to act preflop are read off the seat
+        # order of the hand (left of the button first, the button last).
         if num_players == 2:
-            sb_index = self.state.button_position
-            bb_index = self.table.next_occupied_seat(self.state.button_position)
+            # Heads-up special case:
+            # - Button is SMALL blind and acts first preflop
+            # - Other player is BIG blind
+            sb_index = first_to_act = self.state.button_position
+            bb_index = order[0]
         else:
             # Multi-way:
             # - SB = left of button
             # - BB = left of SB
-            sb_index = self.table.next_occupied_seat(self.state.button_position)
-            bb_index = self.table.next_occupied_seat(sb_index)
-        assert isinstance(sb_index, int)
-        assert isinstance(bb_index, int)
+            # - player left of BB acts first
+            sb_index, bb_index, first_to_act = order[0], order[1], order[2]
 
         # --- Small blind ---
         sb_player = self.table[sb_index]
-        sb_amount = min(self.state.small_blind, sb_player.state.stack)
-        sb_player.state.current_bet = sb_amount
-        sb_player.state.total_contributed = sb_amount
-        sb_player.state.stack -= sb_amount
-        self.state.pot += sb_amount
-        if sb_player.state.stack == 0:
-            sb_player.state.state_type = PlayerStateType.ALL_IN
+        sb_amount = self._commit_chips(sb_player.state, self.state.small_blind)
 
         self._log(
-            f"Posting small blind of {sb_amount} by player {sb_player.name}. "
+            lambda: f"Posting small blind of {sb_amount} by player {sb_player.name}. "
             f"Remaining stack: {sb_player.state.stack}",
             logging.INFO,
         )
 
         # --- Big blind ---
         bb_player = self.table[bb_index]
-        bb_amount = min(self.state.big_blind, bb_player.state.stack)
-        bb_player.state.current_bet = bb_amount
-        bb_player.state.total_contributed = bb_amount
-        bb_player.state.stack -= bb_amount
-        self.state.pot += bb_amount
-        if bb_player.state.stack == 0:
-            bb_player.state.state_type = PlayerStateType.ALL_IN
+        bb_amount = self._commit_chips(bb_player.state, self.state.big_blind)
 
         self._log(
-            f"Posting big blind of {bb_amount} by player {bb_player.name}. "
+            lambda: f"Posting big blind of {bb_amount} by player {bb_player.name}. "
             f"Remaining stack: {bb_player.state.stack}",
             logging.INFO,
         )
@@ -786,73 +1174,41 @@ class Game:
             self.state.big_blind
         )  # preflop min raise increment is BB size
 
-        # Next to act preflop:
-        # - Heads-up: button (SB) acts first
-        # - Multi-way: player left of BB acts first
-        if num_players == 2:
-            self.state.current_player_index = sb_index
-        else:
-            self.state.current_player_index = self.table.next_occupied_seat(bb_index)
-
-        assert isinstance(
-            self.state.current_player_index, int
-        ), "Current player index must be an integer"
+        self.state.current_player_index = first_to_act
 
     def _post_antes(self) -> None:
         """Post antes for all active players."""
-        if not self.state.ante or self.state.ante <= 0:
+        state = self.state
+        ante = state.ante
+        if not ante or ante <= 0:
             return
 
         self._log("Posting antes.", logging.INFO)
-        for player in self.state.players:
-            if player.state.state_type == PlayerStateType.ACTIVE:
-                ante_amount = min(self.state.ante, player.state.stack)
-                player.state.current_bet += ante_amount
-                player.state.total_contributed += ante_amount
-                player.state.stack -= ante_amount
-                self.state.pot += ante_amount
-                if player.state.stack == 0:
-                    player.state.state_type = PlayerStateType.ALL_IN
-
+        commit_chips = self._commit_chips
+        for player in state.players:
+            pstate = player.state
+            if pstate.state_type is _STATE_ACTIVE:
+                ante_amount = commit_chips(pstate, ante)
                 self._log(
-                    f"Player {player.name} posts ante of {ante_amount}. "
-                    f"Remaining stack: {player.state.stack}",
+                    lambda: f"Player {player.name} posts ante of {ante_amount}. "
+                    f"Remaining stack: {pstate.stack}",
                     logging.INFO,
                 )
 
-    def _calculate_raise_components(
-        self, player: PlayerLike, chips_to_add: int
-    ) -> tuple[int, int, int, int, int, bool]:
+    def _commit_chips(self, pstate: PlayerState, amount: int) -> int:
         """
-        Returns:
-            (player_add, player_bet_after, new_table_bet, call_part, raise_size, is_all_in)
+        Move up to ``amount`` chips from the stack of a player into the pot and
+        return the number of chips moved. A player who runs out of chips is all-in.
         """
-        stack_before = player.state.stack
-        player_bet_before = player.state.current_bet
-        old_table_bet = self.state.current_bet
-
-        player_add = min(chips_to_add, stack_before)
-        player_bet_after = player_bet_before + player_add
-
-        # Important: table bet cannot decrease
-        new_table_bet = max(old_table_bet, player_bet_after)
-
-        call_needed = max(0, old_table_bet - player_bet_before)
-        call_part = min(call_needed, player_add)
-
-        # Amount the table bet increases by (0 if player didn't exceed old_table_bet)
-        raise_size = new_table_bet - old_table_bet
-
-        is_all_in = player_add >= stack_before
-
-        return (
-            player_add,
-            player_bet_after,
-            new_table_bet,
-            call_part,
-            raise_size,
-            is_all_in,
-        )
+        stack = pstate.stack
+        if amount >= stack:
+            amount = stack
+            pstate.state_type = _STATE_ALL_IN
+        pstate.stack = stack - amount
+        pstate.current_bet += amount
+        pstate.total_contributed += amount
+        self.state.pot += amount
+        return amount
 
     def _reset_acted_flags_for_reopen(self, raiser_id: str) -> None:
         """
@@ -860,198 +1216,201 @@ class Game:
         Players get re-raise rights back, so we reset acted flags for ACTIVE players
         other than the raiser.
         """
+        active = _STATE_ACTIVE
         for p in self.state.players:
-            if p.id != raiser_id and p.state.state_type == PlayerStateType.ACTIVE:
-                p.state.acted_this_street = False
+            st = p.state
+            if st.state_type is active and st.acted_this_street and p.id != raiser_id:
+                st.acted_this_street = False
+
+    def _reset_acted_flags_for_reopen_heads_up(self, raiser_id: str) -> None:
+        """
+        Specialization of `_reset_acted_flags_for_reopen` for two players, where
+        the raiser is the current player and only the opponent can be reset.
+        """
+        opponent = self.table.seats[self._next_seat[self.state.current_player_index]]
+        pstate = opponent.state
+        if pstate.state_type is _STATE_ACTIVE:
+            pstate.acted_this_street = False
 
     def _register_player_action(self, player: PlayerLike, action: PlayerAction) -> None:
         action_type = action.action_type
-        amount = action.amount or 0
 
         current_player = self.get_current_player()
         if not current_player or current_player.id != player.id:
             raise ValueError("Not this player's turn")
 
-        if current_player.state.state_type != PlayerStateType.ACTIVE:
+        pstate = current_player.state
+        if pstate.state_type is not _STATE_ACTIVE:
             raise ValueError("Player cannot act (folded or all-in)")
 
-        valid_actions = self._get_valid_actions(current_player)
-        if action_type not in valid_actions:
+        if not self._valid_action_bits(current_player) >> action_type.value & 1:
             raise ValueError(f"Invalid action: {action_type}")
 
-        if action_type == ActionType.FOLD:
-            current_player.state.state_type = PlayerStateType.FOLDED
-            self._log(f"Player {current_player.name} folds.", logging.INFO)
+        self._apply_player_action(current_player, action)
 
-        elif action_type == ActionType.CHECK:
-            if current_player.state.current_bet != self.state.current_bet:
-                raise ValueError("Cannot check when there is a bet to call")
-            self._log(f"Player {current_player.name} checks.", logging.INFO)
+    def _apply_player_action(
+        self, current_player: PlayerLike, action: PlayerAction
+    ) -> None:
+        """
+        Apply the action of the current player without checking whose turn it is
+        and whether the action is valid. The engine checks both before calling it.
+        """
+        self._action_handlers[action.action_type._value_](
+            current_player, action.amount or 0
+        )
 
-        elif action_type == ActionType.CALL:
-            call_amount = self.state.current_bet - current_player.state.current_bet
-            actual_amount = min(call_amount, current_player.state.stack)
-            current_player.state.current_bet += actual_amount
-            current_player.state.total_contributed += actual_amount
-            current_player.state.stack -= actual_amount
-            self.state.pot += actual_amount
+        # Mark actor as having acted
+        pstate = current_player.state
+        pstate.acted_this_street = True
+        state = self.state
+        self._log(
+            lambda: f"Current pot: {state.pot} | Current bet: {state.current_bet}",
+            logging.INFO,
+        )
 
-            if current_player.state.stack == 0:
-                current_player.state.state_type = PlayerStateType.ALL_IN
+        # Emit player action event after all state mutations
+        self._emit_event(
+            GameEventType.PLAYER_ACTION_TAKEN,
+            player_id=current_player.id,
+            action=action,
+        )
 
-            self._log(
-                f"Player {current_player.name} calls with amount {actual_amount}. Remaining stack: {current_player.state.stack}.",
-                logging.INFO,
-            )
+    def _apply_fold(self, current_player: PlayerLike, amount: int) -> None:
+        current_player.state.state_type = _STATE_FOLDED
+        self._log(lambda: f"Player {current_player.name} folds.", logging.INFO)
 
-        elif action_type == ActionType.BET:
-            if self.state.current_bet > 0:
-                raise ValueError("Cannot bet when there is already a bet")
-            if amount < self.state.min_bet:
-                raise ValueError(f"Bet must be at least {self.state.min_bet}")
+    def _apply_check(self, current_player: PlayerLike, amount: int) -> None:
+        if current_player.state.current_bet != self.state.current_bet:
+            raise ValueError("Cannot check when there is a bet to call")
+        self._log(lambda: f"Player {current_player.name} checks.", logging.INFO)
 
-            actual_amount = min(amount, current_player.state.stack)
-            current_player.state.current_bet = actual_amount
-            current_player.state.total_contributed += actual_amount
-            current_player.state.stack -= actual_amount
-            self.state.pot += actual_amount
+    def _apply_call(self, current_player: PlayerLike, amount: int) -> None:
+        pstate = current_player.state
+        actual_amount = self._commit_chips(
+            pstate, self.state.current_bet - pstate.current_bet
+        )
 
-            self.state.current_bet = actual_amount
-            self.state.last_raise_size = actual_amount
+        self._log(
+            lambda: f"Player {current_player.name} calls with amount {actual_amount}. Remaining stack: {pstate.stack}.",
+            logging.INFO,
+        )
 
-            if current_player.state.stack == 0:
-                current_player.state.state_type = PlayerStateType.ALL_IN
+    def _apply_bet(self, current_player: PlayerLike, amount: int) -> None:
+        state = self.state
+        pstate = current_player.state
 
-            # A bet opens action for others (everyone else must respond)
-            self._reset_acted_flags_for_reopen(raiser_id=current_player.id)
+        if state.current_bet > 0:
+            raise ValueError("Cannot bet when there is already a bet")
+        min_bet = state.min_bet
+        if amount < min_bet:
+            raise ValueError(f"Bet must be at least {min_bet}")
 
-            self._log(
-                f"Player {current_player.name} bets amount {actual_amount}. Remaining stack: {current_player.state.stack}.",
-                logging.INFO,
-            )
+        actual_amount = self._commit_chips(pstate, amount)
+        state.current_bet = actual_amount
+        state.last_raise_size = actual_amount
 
-        elif action_type == ActionType.RAISE:
-            old_table_bet = self.state.current_bet
-            old_last_raise_size = self.state.last_raise_size
-
-            (
-                player_add,
-                player_bet_after,
-                new_table_bet,
-                _,
-                raise_size,
-                is_all_in,
-            ) = self._calculate_raise_components(current_player, amount)
-
-            if raise_size == 0:
-                raise ValueError("RAISE must increase the table bet")
-
-            # Non-all-in raise must meet minimum raise size
-            if not is_all_in and raise_size < old_last_raise_size:
-                raise ValueError(
-                    f"Raise size must be at least {old_last_raise_size} (attempted {raise_size})"
-                )
+        # A bet opens action for others (everyone else must respond)
+        self._reset_acted_flags_for_reopen(raiser_id=current_player.id)
 
-            current_player.state.current_bet = player_bet_after
-            current_player.state.total_contributed += player_add
-            current_player.state.stack -= player_add
-            self.state.pot += player_add
-            self.state.current_bet = new_table_bet
+        self._log(
+            lambda: f"Player {current_player.name} bets amount {actual_amount}. Remaining stack: {pstate.stack}.",
+            logging.INFO,
+        )
 
-            if is_all_in:
-                current_player.state.state_type = PlayerStateType.ALL_IN
+    def _apply_raise(self, current_player: PlayerLike, amount: int) -> None:
+        state = self.state
+        pstate = current_player.state
+        old_table_bet = state.current_bet
+        old_last_raise_size = state.last_raise_size
+        stack = pstate.stack
 
-            # Reopen betting ONLY on a full raise (>= old_last_raise_size)
-            reopens_betting = raise_size >= old_last_raise_size
+        player_add = amount if amount < stack else stack
+        player_bet_after = pstate.current_bet + player_add
+        # Important: table bet cannot decrease
+        new_table_bet = (
+            player_bet_after if player_bet_after > old_table_bet else old_table_bet
+        )
+        raise_size = new_table_bet - old_table_bet
+        is_all_in = player_add >= stack
 
-            if reopens_betting:
-                self.state.last_raise_size = raise_size
-                self._reset_acted_flags_for_reopen(raiser_id=current_player.id)
-            # else: short all-in raise does NOT reopen betting and must NOT reset flags
+        if raise_size == 0:
+            raise ValueError("RAISE must increase the table bet")
 
-            self._log(
-                f"Player {current_player.name} raises by {player_add} chips "
-                f"to total bet {player_bet_after}. Remaining stack: {current_player.state.stack}.",
-                logging.INFO,
+        # Non-all-in raise must meet minimum raise size
+        if not is_all_in and raise_size < old_last_raise_size:
+            raise ValueError(
+                f"Raise size must be at least {old_last_raise_size} (attempted {raise_size})"
             )
 
-        elif action_type == ActionType.ALL_IN:
-            old_table_bet = self.state.current_bet
-            old_last_raise_size = self.state.last_raise_size
-
-            chips_to_add = current_player.state.stack
-            (
-                player_add,
-                player_bet_after,
-                new_table_bet,
-                _,
-                raise_size,
-                _,
-            ) = self._calculate_raise_components(current_player, chips_to_add)
-
-            current_player.state.current_bet = player_bet_after
-            current_player.state.total_contributed += player_add
-            current_player.state.stack = 0
-            self.state.pot += player_add
-            current_player.state.state_type = PlayerStateType.ALL_IN
-
-            # If the all-in increases the table bet, update it
-            if new_table_bet > old_table_bet:
-                self.state.current_bet = new_table_bet
-
-                # Reopen betting ONLY if raise_size meets minimum
-                reopens_betting = raise_size >= old_last_raise_size
-                if reopens_betting:
-                    self.state.last_raise_size = raise_size
-                    self._reset_acted_flags_for_reopen(raiser_id=current_player.id)
-                # else: SHORT all-in -> DOES NOT reopen betting -> DO NOT reset acted flags
+        self._commit_chips(pstate, player_add)
+        state.current_bet = new_table_bet
 
-            self._log(
-                f"Player {current_player.name} goes all-in with {player_add} chips.",
-                logging.INFO,
-            )
+        # Reopen betting ONLY on a full raise (>= old_last_raise_size)
+        reopens_betting = raise_size >= old_last_raise_size
+
+        if reopens_betting:
+            state.last_raise_size = raise_size
+            self._reset_acted_flags_for_reopen(raiser_id=current_player.id)
+        # else: short all-in raise does NOT reopen betting and must NOT reset flags
 
-        # Mark actor as having acted
-        current_player.state.acted_this_street = True
         self._log(
-            f"Current pot: {self.state.pot} | Current bet: {self.state.current_bet}",
+            lambda: f"Player {current_player.name} raises by {player_add} chips "
+            f"to total bet {player_bet_after}. Remaining stack: {pstate.stack}.",
             logging.INFO,
         )
 
-        # Emit player action event after all state mutations
-        self._emit(
-            self._create_event(
-                GameEventType.PLAYER_ACTION_TAKEN,
-                player_id=current_player.id,
-                action=action,
-            )
-        )
+    def _apply_all_in(self, current_player: PlayerLike, amount: int) -> None:
+        state = self.state
+        pstate = current_player.state
+        old_table_bet = state.current_bet
+        old_last_raise_size = state.last_raise_size
 
-    def _get_valid_actions(self, player: PlayerLike) -> list[ActionType]:
-        actions = [ActionType.FOLD]
+        player_add = pstate.stack
+        player_bet_after = pstate.current_bet + player_add
+        new_table_bet = (
+            player_bet_after if player_bet_after > old_table_bet else old_table_bet
+        )
+        raise_size = new_table_bet - old_table_bet
 
-        call_amount = self.state.current_bet - player.state.current_bet
+        self._commit_chips(pstate, player_add)
 
-        if call_amount == 0:
-            actions.append(ActionType.CHECK)
-        else:
-            if call_amount > 0 and player.state.stack > 0:
-                actions.append(ActionType.CALL)
+        # If the all-in increases the table bet, update it
+        if new_table_bet > old_table_bet:
+            state.current_bet = new_table_bet
 
-        if self.state.current_bet == 0 and player.state.stack >= self.state.min_bet:
-            actions.append(ActionType.BET)
+            # Reopen betting ONLY if raise_size meets minimum
+            reopens_betting = raise_size >= old_last_raise_size
+            if reopens_betting:
+                state.last_raise_size = raise_size
+                self._reset_acted_flags_for_reopen(raiser_id=current_player.id)
+            # else: SHORT all-in -> DOES NOT reopen betting -> DO NOT reset acted flags
 
-        if self.state.current_bet > 0:
-            min_raise_increment = self.state.last_raise_size
-            call_amount = self.state.current_bet - player.state.current_bet
-            total_needed_for_min_raise = call_amount + min_raise_increment
-            if player.state.stack >= total_needed_for_min_raise:
-                actions.append(ActionType.RAISE)
+        self._log(
+            lambda: f"Player {current_player.name} goes all-in with {player_add} chips.",
+            logging.INFO,
+        )
 
-        if player.state.stack > 0:
-            actions.append(ActionType.ALL_IN)
+    def _valid_action_bits(self, player: PlayerLike) -> int:
+        """
+        Return the valid actions of a player as a bitmask, where the bit of an
+        action is ``1 << action.value``.
+        """
+        state = self.state
+        stack = player.state.stack
+        current_bet = state.current_bet
+        call_amount = current_bet - player.state.current_bet
+        return (
+            _FOLD_BIT
+            | (call_amount == 0) << _CHECK
+            | (call_amount > 0 and stack > 0) << _CALL
+            | (current_bet == 0 and stack >= state.min_bet) << _BET
+            | (current_bet > 0 and stack >= call_amount + state.last_raise_size)
+            << _RAISE
+            | (stack > 0) << _ALL_IN
+        )
 
-        return actions
+    def _get_valid_actions(self, player: PlayerLike) -> list[ActionType]:
+        return list(_ACTIONS_BY_BITS[self._valid_action_bits(player)])
 
     def _advance_to_next_player(self) -> None:
         """
@@ -1062,65 +1421,77 @@ class Game:
         if they are facing a bet (player.current_bet < table.current_bet). This is
         what makes short all-ins work correctly without resetting acted flags.
         """
-        idx = self.state.current_player_index
-        num_players = len(self.state.players)
-
-        for _ in range(num_players):
+        state = self.state
+        idx = state.current_player_index
+        table_bet = state.current_bet
+        active = _STATE_ACTIVE
+        seat_order = self._seat_order or self._compute_seat_order()
+        next_seat = self._next_seat
+        seats = self.table.seats
+
+        # the seat order of the hand holds every seated player exactly once
+        for _ in seat_order:
             # get player at next occupied seat
-            idx = self.table.next_occupied_seat(idx)
-            p = self.table[idx]
+            idx = next_seat[idx]
+            pstate = seats[idx].state
 
             # skip if not active
-            if p.state.state_type != PlayerStateType.ACTIVE:
+            if pstate.state_type is not active:
                 continue
 
             # check if player needs to act
-            facing_call = p.state.current_bet < self.state.current_bet
-            needs_action = (not p.state.acted_this_street) or facing_call
+            facing_call = pstate.current_bet < table_bet
+            needs_action = (not pstate.acted_this_street) or facing_call
 
             if needs_action:
                 # we've found the next player who needs to act
-                self.state.current_player_index = idx
+                state.current_player_index = idx
+                return
+
+    def _advance_to_next_player_heads_up(self) -> None:
+        """
+        Specialization of `_advance_to_next_player` for two players, checking the
+        opponent first and then the player who just acted.
+        """
+        state = self.state
+        table_bet = state.current_bet
+        active = _STATE_ACTIVE
+        seats = self.table.seats
+        opponent = self._next_seat[state.current_player_index]
+
+        for idx in (opponent, self._next_seat[opponent]):
+            pstate = seats[idx].state
+            if pstate.state_type is active and (
+                not pstate.acted_this_street or pstate.current_bet < table_bet
+            ):
+                state.current_player_index = idx
                 return
 
     def _complete_betting_round(self) -> None:
-        for player in self.state.players:
-            player.state.current_bet = 0
-            player.state.acted_this_street = False
-        self.state.current_bet = 0
-        self.state.last_raise_size = 0
+        state = self.state
+        for player in state.players:
+            pstate = player.state
+            pstate.current_bet = 0
+            pstate.acted_this_street = False
+        state.current_bet = 0
+        state.last_raise_size = 0
         self._log("Betting round complete\n", logging.INFO)
 
     def _advance_to_first_active_player(self) -> None:
-        self.state.current_player_index = self.table.next_occupied_seat(
-            self.state.button_position,
-            active=True,
-        )
-
-    def _deal_flop(self) -> None:
-        self.state.deck.deal(1)
-        flop_cards = self.state.deck.deal(3)
-        self.state.community_cards.extend(flop_cards)
-        self._log(
-            f"Dealt flop. Community cards: {[card.utf8() for card in self.state.community_cards]}",
-            logging.INFO,
-        )
-
-    def _deal_turn(self) -> None:
-        self.state.deck.deal(1)
-        turn_card = self.state.deck.deal(1)[0]
-        self.state.community_cards.append(turn_card)
-        self._log(
-            f"Dealt turn. Community cards: {[card.utf8() for card in self.state.community_cards]}",
-            logging.INFO,
-        )
+        seats = self.table.seats
+        active = _STATE_ACTIVE
+        for seat in self._seat_order or self._compute_seat_order():
+            if seats[seat].state.state_type is active:
+                self.state.current_player_index = seat
+                return
+        self.state.current_player_index = None
 
-    def _deal_river(self) -> None:
-        self.state.deck.deal(1)
-        river_card = self.state.deck.deal(1)[0]
-        self.state.community_cards.append(river_card)
+    def _deal_street(self, street: Street, n_cards: int) -> None:
+        # the burn card is drawn together with the dealt cards
+        community_cards = self.state.community_cards
+        community_cards += self.state.deck.deal(n_cards + 1)[1:]
         self._log(
-            f"Dealt river. Community cards: {[card.utf8() for card in self.state.community_cards]}",
+            lambda: f"Dealt {street.name.lower()}. Community cards: {[card.utf8() for card in community_cards]}",
             logging.INFO,
         )
 
@@ -1129,14 +1500,12 @@ class Game:
         self.state.button_position = self.table.button_seat
 
     def _winners_in_button_order(self, winners: list[PlayerLike]) -> list[PlayerLike]:
-        n_players = len(self.state.players)
-        idx = self.state.button_position  # seat index of the button player
-        rel_btn_idx = {}
-        for i in range(n_players):
-            idx = self.table.next_occupied_seat(idx)
-            p = self.table[idx]
-            rel_btn_idx[p.id] = i
-        return sorted(winners, key=lambda p: rel_btn_idx[p.id])
+        # distance of the seat clockwise from the button, the button itself last
+        n_seats = len(self.table)
+        first_seat = self.state.button_position + 1
+        keyed = [((p.state.seat - first_seat) % n_seats, p) for p in winners]
+        keyed.sort(key=itemgetter(0))
+        return [p for _, p in keyed]
 
     def _handle_showdown(self) -> None:
         players_in_hand = self.state.get_players_in_hand()
@@ -1145,15 +1514,13 @@ class Game:
             winner = players_in_hand[0]
             winner.state.stack += self.state.pot
             self._log(
-                f"Player {winner.name} wins {self.state.pot} from the pot.",
+                lambda: f"Player {winner.name} wins {self.state.pot} from the pot.",
                 logging.INFO,
             )
-            self._emit(
-                self._create_event(
-                    GameEventType.POT_WON,
-                    player_id=winner.id,
-                    payload={"amount": self.state.pot},
-                )
+            self._emit_event(
+                GameEventType.POT_WON,
+                player_id=winner.id,
+                payload={"amount": self.state.pot},
             )
             self.state.pot = 0
         else:
@@ -1168,48 +1535,60 @@ class Game:
                 self.state.pot == all_contributions
             ), f"{self.state.pot} vs {all_contributions}"
 
-            # Calculate best hands and scores for all players in hand
-            player_scores: list[tuple[PlayerLike, float]] = []
+            # Calculate best hands and ranks for all players in hand (lower is better)
+            community_cards = self.state.community_cards
+            community_ints = [card.int_value for card in community_cards]
+            holdings = []
             for player in players_in_hand:
-                if player.state.holding:
-                    player_holding = " ".join(
-                        card.utf8() for card in player.state.holding.cards
-                    )
-                    self._log(
-                        f"Player {player.name} has holding {player_holding} at showdown,",
-                        logging.INFO,
-                    )
-                    best_hand, best_hand_type, best_score = find_highest_scoring_hand(
-                        private_cards=player.state.holding.cards,
-                        community_cards=self.state.community_cards,
-                        n_private=self.rules.showdown.hole_cards_required,
-                    )
-                    player_scores.append((player, best_score))
-
-                    self._emit(
-                        self._create_event(
-                            GameEventType.PLAYER_CARDS_REVEALED,
-                            player_id=player.id,
-                            payload={
-                                "holding": [
-                                    card.code() for card in player.state.holding.cards
-                                ],
-                                "best_hand": [card.code() for card in best_hand],
-                                "best_hand_type": best_hand_type.name,
-                                "best_score": best_score,
-                            },
-                        )
-                    )
-                    self._log(
-                        (
-                            f"Player {player.name} has hand {best_hand_type.name} with "
-                            f"cards {[card.utf8() for card in best_hand]}"
-                            f" (score: {best_score:.8g})"
-                        ),
-                        logging.INFO,
-                    )
+                holding = player.state.holding
+                if holding:
+                    holdings.append((player, holding.cards))
+            # the players share the community cards, evaluate them all at once
+            best = best_hands(
+                private_cards=[
+                    [card.int_value for card in hole_cards]
+                    for _, hole_cards in holdings
+                ],
+                community_cards=community_ints,
+                n_private=self.rules.showdown.hole_cards_required,
+            )
+            player_ranks: list[tuple[PlayerLike, int]] = []
+            for (player, hole_cards), (best_rank, best_indices) in zip(holdings, best):
+                self._log(
+                    lambda: f"Player {player.name} has holding "
+                    f"{' '.join(card.utf8() for card in hole_cards)} at showdown,",
+                    logging.INFO,
+                )
+                # indices refer to the hole cards followed by the community cards
+                n_hole = len(hole_cards)
+                best_hand_cards = [
+                    hole_cards[i] if i < n_hole else community_cards[i - n_hole]
+                    for i in best_indices
+                ]
+                best_hand_type = hand_type_from_rank(best_rank)
+                best_score = score_from_rank(best_rank)
+                player_ranks.append((player, best_rank))
+
+                self._emit_event(
+                    GameEventType.PLAYER_CARDS_REVEALED,
+                    player_id=player.id,
+                    payload={
+                        "holding": [card.code() for card in hole_cards],
+                        "best_hand": [card.code() for card in best_hand_cards],
+                        "best_hand_type": best_hand_type.name,
+                        "best_score": best_score,
+                    },
+                )
+                self._log(
+                    lambda: (
+                        f"Player {player.name} has hand {best_hand_type.name} with "
+                        f"cards {[card.utf8() for card in best_hand_cards]}"
+                        f" (score: {best_score:.8g})"
+                    ),
+                    logging.INFO,
+                )
 
-            score_by_id = {p.id: s for p, s in player_scores}
+            rank_by_id = {p.id: r for p, r in player_ranks}
             players_in_hand_ids = {p.id for p in players_in_hand}
 
             # Record total contributions for pot distribution
@@ -1225,46 +1604,54 @@ class Game:
             awards = {p.id: 0 for p in self.state.players}
             previous_level = 0
             for level in contribution_levels:
-                segment_contributors = [
-                    p for p in self.state.players if contributions[p.id] >= level
-                ]
+                # a single pass collects the contributors of the segment and the
+                # winners among the eligible ones, who must have contributed enough
+                # AND not folded (a lower rank is a better hand)
+                n_contributors = 0
+                lone = None
+                segment_best_rank: Optional[int] = None
+                segment_winners: list[PlayerLike] = []
+                for p in self.state.players:
+                    if contributions[p.id] < level:
+                        continue
+                    n_contributors += 1
+                    lone = p
+                    if p.id in players_in_hand_ids:
+                        rank = rank_by_id[p.id]
+                        if segment_best_rank is None or rank < segment_best_rank:
+                            segment_best_rank = rank
+                            segment_winners = [p]
+                        elif rank == segment_best_rank:
+                            segment_winners.append(p)
+
                 delta = level - previous_level
-                segment_amount = delta * len(segment_contributors)
+                segment_amount = delta * n_contributors
                 previous_level = level
 
-                # eligibility: must have contributed enough AND not folded
-                eligible = [
-                    p for p in segment_contributors if p.id in players_in_hand_ids
-                ]
-
-                if not eligible:  # pragma: no cover
+                if not segment_winners:  # pragma: no cover
                     # should never happen in a sane game, but don't crash silently
                     raise RuntimeError("No eligible players for a pot segment.")
 
                 # Deduct distributed segment from pot
                 self.state.pot -= segment_amount
 
-                if len(segment_contributors) == 1:
+                if n_contributors == 1:
                     # uncalled top layer -> refund to that one contributor
-                    lone = segment_contributors[0]
                     awards[lone.id] += segment_amount
                     continue
 
-                # determine winners among eligible for THIS segment
-                best = max(score_by_id[p.id] for p in eligible)
-                segment_winners = [p for p in eligible if score_by_id[p.id] == best]
-
                 share, rem = divmod(segment_amount, len(segment_winners))
 
                 # distribute shares
                 for w in segment_winners:
                     awards[w.id] += share
 
-                # distribute remainder in relative button order
-                segment_winners_sorted = self._winners_in_button_order(segment_winners)
-                for i in range(rem):
-                    idx = i % len(segment_winners_sorted)
-                    awards[segment_winners_sorted[idx].id] += 1
+                # distribute remainder in relative button order, the order is only
+                # needed for a split pot that does not divide evenly; the remainder
+                # is always smaller than the number of winners
+                if rem:
+                    for w in self._winners_in_button_order(segment_winners)[:rem]:
+                        awards[w.id] += 1
 
             # Sanity check if the pot is fully distributed
             assert (
@@ -1282,14 +1669,13 @@ class Game:
                 player.state.stack += amount
                 pot_distributed += amount
                 self._log(
-                    f"Player {player.name} wins {amount} from the pot.", logging.INFO
+                    lambda: f"Player {player.name} wins {amount} from the pot.",
+                    logging.INFO,
                 )
-                self._emit(
-                    self._create_event(
-                        GameEventType.POT_WON,
-                        player_id=player.id,
-                        payload={"amount": amount},
-                    )
+                self._emit_event(
+                    GameEventType.POT_WON,
+                    player_id=player.id,
+                    payload={"amount": amount},
                 )
 
             # Final sanity check
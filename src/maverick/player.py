@@ -27,9 +27,21 @@ class PlayerMeta(ABCMeta):
 
 
 class Player(metaclass=PlayerMeta):
-    """Abstract base class for a poker player."""
+    """Abstract base class for a poker player.
+
+    Attributes
+    ----------
+    observes_events : bool
+        If False, the event hooks of the player (``on_event`` and the
+        ``on_<event type>`` hooks) are not called. Games that record no history
+        skip creating events nobody observes, so players without hooks can opt out
+        to make simulations cheaper. Defaults to True.
+
+        .. versionadded:: 0.3.0
+    """
 
     register: bool = True
+    observes_events: bool = True
 
     def __init__(
         self,
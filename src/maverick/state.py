@@ -147,26 +147,26 @@ class GameState(BaseModel):
 
     def is_betting_round_complete(self) -> bool:
         """Betting round is complete when no further action is possible/required."""
-        in_hand = [
-            p for p in self.players if p.state.state_type != PlayerStateType.FOLDED
-        ]
-
-        # If only one player remains, hand is effectively over
-        if len(in_hand) <= 1:
-            return True
-
-        can_act = [p for p in in_hand if p.state.state_type == PlayerStateType.ACTIVE]
-
-        # If nobody can act (everyone left is all-in), betting is complete
-        if not can_act:
-            return True
-
-        # Everyone who can act must have acted since the last reopen
-        if not all(p.state.acted_this_street for p in can_act):
-            return False
-
-        # Everyone who can act must have matched the current bet
-        if not all(p.state.current_bet == self.current_bet for p in can_act):
-            return False
+        # A single pass over the players: the round is complete if at most one
+        # player is left in the hand, or if every player who can act (everyone left
+        # all-in means nobody can) has acted since the last reopen and matched the
+        # current bet.
+        folded = PlayerStateType.FOLDED
+        active = PlayerStateType.ACTIVE
+        current_bet = self.current_bet
+        in_hand = 0
+        pending = False
+        for p in self.players:
+            pstate = p.state
+            state_type = pstate.state_type
+            if state_type is folded:
+                continue
+            in_hand += 1
+            if state_type is active and (
+                not pstate.acted_this_street or pstate.current_bet != current_bet
+            ):
+                pending = True
+            if pending and in_hand > 1:
+                return False
 
         return True
@@ -96,6 +96,19 @@ class Table:
         player.state.seat = None
         del self._id_to_seat[player.id]
 
+    def clone(self, players: dict[str, PlayerLike]) -> "Table":
+        """
+        Return a copy of the table, with every seated player replaced by the player
+        of the same id from ``players``.
+
+        .. versionadded:: 0.3.0
+        """
+        table = Table(n_seats=self._n_seats)
+        table._seats = [None if p is None else players[p.id] for p in self._seats]
+        table._id_to_seat = dict(self._id_to_seat)
+        table._button_seat = self._button_seat
+        return table
+
     def get_player_seat(self, player: PlayerLike) -> Optional[int]:
         """Get the seat index of the specified player, or None if not seated."""
         return self._id_to_seat.get(player.id, None)
@@ -1,8 +1,26 @@
 from .holding_strength import estimate_holding_strength
+from .simulation import simulate_games
 from .scoring import score_hand, find_highest_scoring_hand
+from .evaluator import (
+    card_to_int,
+    eval5,
+    eval7,
+    best_hand,
+    best_hands,
+    hand_type_from_rank,
+    score_from_rank,
+)
 
 __all__ = [
     "estimate_holding_strength",
+    "simulate_games",
     "score_hand",
     "find_highest_scoring_hand",
+    "card_to_int",
+    "eval5",
+    "eval7",
+    "best_hand",
+    "best_hands",
+    "hand_type_from_rank",
+    "score_from_rank",
 ]
@@ -0,0 +1,506 @@
+"""
+Lookup table based hand evaluation.
+
+Cards are encoded as 32-bit integers following Cactus Kev's scheme::
+
+    +--------+--------+--------+--------+
+    |xxxbbbbb|bbbbbbbb|cdhsrrrr|xxpppppp|
+    +--------+--------+--------+--------+
+
+    p    = prime number of the rank (deuce = 2, trey = 3, ..., ace = 41)
+    r    = index of the rank (deuce = 0, trey = 1, ..., ace = 12)
+    cdhs = suit bit (clubs, diamonds, hearts, spades)
+    b    = bit of the rank
+
+Every 5-card hand falls into one of 7462 equivalence classes. Flushes are looked up
+by the OR of the rank bits, all other hands by the product of the rank primes, which
+is unique for every multiset of ranks. The resulting rank goes from 1 (royal flush)
+to 7462 (7-5-4-3-2 offsuit), lower is better.
+"""
+
+from typing import TYPE_CHECKING, Sequence
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import combinations
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..card import Card
+
+from ..enums import Suit, Rank, HandType
+from .scoring import score_hand
+
+__all__ = [
+    "MAX_RANK",
+    "card_to_int",
+    "eval5",
+    "eval7",
+    "best_hand",
+    "best_hands",
+    "hand_type_from_rank",
+    "score_from_rank",
+]
+
+MAX_RANK = 7462
+"""The rank of the weakest possible hand."""
+
+_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+_SUIT_BITS = {
+    Suit.SPADES: 0x1000,
+    Suit.HEARTS: 0x2000,
+    Suit.DIAMONDS: 0x4000,
+    Suit.CLUBS: 0x8000,
+}
+
+_CARD_INTS = {
+    (suit, rank): (
+        (1 << (16 + rank.value - 2))
+        | suit_bit
+        | ((rank.value - 2) << 8)
+        | _PRIMES[rank.value - 2]
+    )
+    for suit, suit_bit in _SUIT_BITS.items()
+    for rank in Rank
+}
+
+
+def card_to_int(card: "Card") -> int:
+    """Return the Cactus Kev integer encoding of a card."""
+    return _CARD_INTS[card.suit, card.rank]
+
+
+def _rank_mask(ranks: Sequence[int]) -> int:
+    mask = 0
+    for r in ranks:
+        mask |= 1 << r
+    return mask
+
+
+def _prime_product(ranks: Sequence[int]) -> int:
+    product = 1
+    for r in ranks:
+        product *= _PRIMES[r]
+    return product
+
+
+def _build_lookup_tables() -> tuple[dict[int, int], dict[int, int]]:
+    """Enumerate the 7462 equivalence classes from the strongest to the weakest."""
+    flush_lookup: dict[int, int] = {}
+    unsuited_lookup: dict[int, int] = {}
+
+    ranks = range(12, -1, -1)  # ace to deuce
+    straights = [tuple(range(high, high - 5, -1)) for high in range(12, 3, -1)]
+    straights.append((12, 3, 2, 1, 0))  # the wheel is five high
+    straight_masks = {_rank_mask(s) for s in straights}
+    no_pairs = [
+        c for c in combinations(ranks, 5) if _rank_mask(c) not in straight_masks
+    ]
+
+    rank = 1
+
+    # straight flushes (the first one is the royal flush)
+    for straight in straights:
+        flush_lookup[_rank_mask(straight)] = rank
+        rank += 1
+
+    # four of a kind
+    for quad in ranks:
+        for kicker in ranks:
+            if kicker != quad:
+                unsuited_lookup[_prime_product((quad,) * 4 + (kicker,))] = rank
+                rank += 1
+
+    # full house
+    for trips in ranks:
+        for pair in ranks:
+            if pair != trips:
+                unsuited_lookup[_prime_product((trips,) * 3 + (pair,) * 2)] = rank
+                rank += 1
+
+    # flush
+    for combo in no_pairs:
+        flush_lookup[_rank_mask(combo)] = rank
+        rank += 1
+
+    # straight
+    for straight in straights:
+        unsuited_lookup[_prime_product(straight)] = rank
+        rank += 1
+
+    # three of a kind
+    for trips in ranks:
+        kickers = [r for r in ranks if r != trips]
+        for combo in combinations(kickers, 2):
+            unsuited_lookup[_prime_product((trips,) * 3 + combo)] = rank
+            rank += 1
+
+    # two pair
+    for high, low in combinations(ranks, 2):
+        for kicker in ranks:
+            if kicker not in (high, low):
+                unsuited_lookup[_prime_product((high, high, low, low, kicker))] = rank
+                rank += 1
+
+    # pair
+    for pair in ranks:
+        kickers = [r for r in ranks if r != pair]
+        for combo in combinations(kickers, 3):
+            unsuited_lookup[_prime_product((pair, pair) + combo)] = rank
+            rank += 1
+
+    # high card
+    for combo in no_pairs:
+        unsuited_lookup[_prime_product(combo)] = rank
+        rank += 1
+
+    assert rank - 1 == MAX_RANK
+    return flush_lookup, unsuited_lookup
+
+
+FLUSH_LOOKUP, UNSUITED_LOOKUP = _build_lookup_tables()
+
+# The weakest rank of every hand type, from the strongest hand type to the weakest
+_HAND_TYPE_BANDS = (
+    (1, HandType.ROYAL_FLUSH),
+    (10, HandType.STRAIGHT_FLUSH),
+    (166, HandType.FOUR_OF_A_KIND),
+    (322, HandType.FULL_HOUSE),
+    (1599, HandType.FLUSH),
+    (1609, HandType.STRAIGHT),
+    (2467, HandType.THREE_OF_A_KIND),
+    (3325, HandType.TWO_PAIR),
+    (6185, HandType.PAIR),
+    (MAX_RANK, HandType.HIGH_CARD),
+)
+_BAND_LIMITS = tuple(limit for limit, _ in _HAND_TYPE_BANDS)
+
+
+def hand_type_from_rank(rank: int) -> HandType:
+    """Return the type of a hand given its rank.
+
+    Every hand type occupies a contiguous band of ranks, so no cards are needed.
+    """
+    return _HAND_TYPE_BANDS[bisect_left(_BAND_LIMITS, rank)][1]
+
+
+def _build_rank_hands() -> tuple[tuple[tuple[int, ...], bool], ...]:
+    """
+    Return the rank indices of a hand of every rank, and whether the hand is a
+    flush, by inverting the lookup tables.
+    """
+    hands: list[tuple[tuple[int, ...], bool]] = [((), False)] * MAX_RANK
+    for mask, rank in FLUSH_LOOKUP.items():
+        hands[rank - 1] = (tuple(r for r in range(12, -1, -1) if mask >> r & 1), True)
+    for product, rank in UNSUITED_LOOKUP.items():
+        ranks = []
+        for r in range(12, -1, -1):
+            while product % _PRIMES[r] == 0:
+                product //= _PRIMES[r]
+                ranks.append(r)
+        hands[rank - 1] = (tuple(ranks), False)
+    return tuple(hands)
+
+
+_RANK_HANDS = _build_rank_hands()
+
+# the suits of a hand that is not a flush
+_OFFSUIT = (Suit.SPADES, Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS, Suit.SPADES)
+
+
+@lru_cache(maxsize=None)
+def score_from_rank(rank: int) -> float:
+    """Return the score :func:`score_hand` gives to the 5-card hands of a rank.
+
+    Hands of the same rank have the same score, so the score is computed once for
+    a hand of every rank that is asked for.
+
+    .. versionadded:: 0.3.0
+    """
+    from ..card import Card  # the card module imports this one
+
+    ranks, flush = _RANK_HANDS[rank - 1]
+    suits = (Suit.SPADES,) * 5 if flush else _OFFSUIT
+    cards = [Card(suit=suit, rank=Rank(r + 2)) for suit, r in zip(suits, ranks)]
+    return score_hand(cards)[1]
+
+
+def eval5(c1: int, c2: int, c3: int, c4: int, c5: int) -> int:
+    """Return the rank of a 5-card hand given as Cactus Kev integers."""
+    if c1 & c2 & c3 & c4 & c5 & 0xF000:
+        return FLUSH_LOOKUP[(c1 | c2 | c3 | c4 | c5) >> 16]
+    return UNSUITED_LOOKUP[
+        (c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)
+    ]
+
+
+_FLUSH_CACHE: dict[int, int] = {}
+_UNSUITED_CACHE: dict[int, int] = {}
+
+
+def _eval_flush(mask: int) -> int:
+    """Return the best flush rank of a mask with at least 5 rank bits set."""
+    rank = _FLUSH_CACHE.get(mask)
+    if rank is None:
+        bits = [1 << r for r in range(13) if mask & (1 << r)]
+        rank = min(
+            FLUSH_LOOKUP[b1 | b2 | b3 | b4 | b5]
+            for b1, b2, b3, b4, b5 in combinations(bits, 5)
+        )
+        _FLUSH_CACHE[mask] = rank
+    return rank
+
+
+def eval7(cards: Sequence[int]) -> int:
+    """Return the rank of the best 5-card hand that can be made of the cards.
+
+    Despite the name, any number of cards (at least 5) is accepted.
+
+    Notes
+    -----
+    With at most 7 cards, a flush excludes quads and full houses, hence the result
+    only depends on the ranks of the suited cards if there is a flush, and on the
+    multiset of ranks otherwise. The product of the rank primes is a perfect hash of
+    that multiset, so both cases are memoized and a repeated composition costs a
+    single dict probe instead of 21 evaluations.
+    """
+    if len(cards) > 7:
+        best = MAX_RANK
+        flush_lookup = FLUSH_LOOKUP
+        unsuited_lookup = UNSUITED_LOOKUP
+        for c1, c2, c3, c4, c5 in combinations(cards, 5):
+            if c1 & c2 & c3 & c4 & c5 & 0xF000:
+                rank = flush_lookup[(c1 | c2 | c3 | c4 | c5) >> 16]
+            else:
+                rank = unsuited_lookup[
+                    (c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)
+                ]
+            if rank < best:
+                best = rank
+        return best
+
+    for suit_bit in (0x1000, 0x2000, 0x4000, 0x8000):
+        suited = [c for c in cards if c & suit_bit]
+        if len(suited) >= 5:
+            mask = 0
+            for c in suited:
+                mask |= c
+            return _eval_flush(mask >> 16)
+
+    key = 1
+    for c in cards:
+        key *= c & 0xFF
+    rank = _UNSUITED_CACHE.get(key)
+    if rank is None:
+        rank = MAX_RANK
+        for c1, c2, c3, c4, c5 in combinations(cards, 5):
+            r = UNSUITED_LOOKUP[
+                (c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)
+            ]
+            if r < rank:
+                rank = r
+        _UNSUITED_CACHE[key] = rank
+    return rank
+
+
+_INDEX_COMBINATIONS: dict[tuple[int, int, int], tuple[tuple[int, ...], ...]] = {}
+
+
+def _index_combinations(
+    n_cards: int, n_hole: int, n_private: int
+) -> tuple[tuple[int, ...], ...]:
+    """
+    Return the indices of the 5-card hands of n_cards cards with exactly n_private of
+    the first n_hole cards (any number if n_private is 0), memoized per layout.
+    """
+    key = (n_cards, n_hole, n_private)
+    subsets = _INDEX_COMBINATIONS.get(key)
+    if subsets is None:
+        subsets = tuple(
+            indices
+            for indices in combinations(range(n_cards), 5)
+            if n_private == 0 or sum(i < n_hole for i in indices) == n_private
+        )
+        _INDEX_COMBINATIONS[key] = subsets
+    return subsets
+
+
+def best_hand(
+    private_cards: Sequence[int],
+    community_cards: Sequence[int],
+    n_private: int = 0,
+) -> tuple[int, tuple[int, ...]]:
+    """
+    Find the best 5-card hand from the given private and community cards with
+    exactly n_private cards from the private cards.
+
+    Parameters
+    ----------
+    private_cards : Sequence[int]
+        The player's private cards as Cactus Kev integers.
+    community_cards : Sequence[int]
+        The community cards as Cactus Kev integers.
+    n_private : int, optional
+        The number of private cards that must be included in the hand (default is 0).
+        A value of 0 means any number of private cards can be used.
+
+    Returns
+    -------
+    tuple[int, tuple[int, ...]]
+        The rank of the best hand and the indices of its cards in the concatenation
+        of private and community cards. The indices are empty if there is no valid
+        hand.
+    """
+    cards = (*private_cards, *community_cards)
+    n_hole = len(private_cards)
+
+    best_rank = MAX_RANK + 1
+    best_indices: tuple[int, ...] = ()
+
+    # the rank of the best hand is known up front, stop at the first hand reaching it
+    target = eval7(cards) if n_private == 0 and 5 <= len(cards) <= 7 else 0
+
+    # eval5 is inlined with the tables bound to locals, this loop is the hot spot
+    flush_lookup = FLUSH_LOOKUP
+    unsuited_lookup = UNSUITED_LOOKUP
+
+    for indices in _index_combinations(len(cards), n_hole, n_private):
+        i1, i2, i3, i4, i5 = indices
+        c1, c2, c3, c4, c5 = cards[i1], cards[i2], cards[i3], cards[i4], cards[i5]
+        if c1 & c2 & c3 & c4 & c5 & 0xF000:
+            rank = flush_lookup[(c1 | c2 | c3 | c4 | c5) >> 16]
+        else:
+            rank = unsuited_lookup[
+                (c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)
+            ]
+        if rank < best_rank:
+            best_rank = rank
+            best_indices = indices
+            if rank == target:
+                break
+
+    return best_rank, best_indices
+
+
+def _subset_parts(
+    cards: Sequence[int], subsets: Sequence[tuple[int, ...]]
+) -> tuple[list[int], list[int], list[int]]:
+    """
+    Return the AND of the suit bits, the OR of the rank bits and the product of the
+    rank primes of every subset of the cards.
+    """
+    ands, ors, products = [], [], []
+    for subset in subsets:
+        suits, bits, product = 0xF000, 0, 1
+        for i in subset:
+            c = cards[i]
+            suits &= c
+            bits |= c
+            product *= c & 0xFF
+        ands.append(suits)
+        ors.append(bits)
+        products.append(product)
+    return ands, ors, products
+
+
+_Plan = tuple[
+    list[tuple[int, ...]], list[tuple[int, ...]], list[tuple[int, int, tuple]]
+]
+_PLANS: dict[tuple[int, int, int], _Plan] = {}
+
+
+def _combination_plan(n_hole: int, n_community: int, n_private: int) -> _Plan:
+    """
+    Split the 5-card combinations of the hole cards followed by the community cards
+    into a part from the hole cards and a part from the community cards, in the order
+    in which best_hand visits them. Plans only depend on the numbers of cards and are
+    built once.
+    """
+    key = (n_hole, n_community, n_private)
+    plan = _PLANS.get(key)
+    if plan is None:
+        plan = _PLANS[key] = _build_combination_plan(*key)
+    return plan
+
+
+def _build_combination_plan(n_hole: int, n_community: int, n_private: int) -> _Plan:
+    hole_subsets: dict[tuple[int, ...], int] = {}
+    community_subsets: dict[tuple[int, ...], int] = {}
+    plan = []
+    for indices in _index_combinations(n_hole + n_community, n_hole, n_private):
+        hole = tuple(i for i in indices if i < n_hole)
+        community = tuple(i - n_hole for i in indices if i >= n_hole)
+        h = hole_subsets.setdefault(hole, len(hole_subsets))
+        c = community_subsets.setdefault(community, len(community_subsets))
+        plan.append((h, c, indices))
+    return list(hole_subsets), list(community_subsets), plan
+
+
+def best_hands(
+    private_cards: Sequence[Sequence[int]],
+    community_cards: Sequence[int],
+    n_private: int = 0,
+) -> list[tuple[int, tuple[int, ...]]]:
+    """
+    Find the best 5-card hand of several players sharing the same community cards.
+
+    The result is the same as calling `best_hand` for every player, but the suit,
+    rank and prime parts of the community cards are combined once for all players.
+
+    Parameters
+    ----------
+    private_cards : Sequence[Sequence[int]]
+        The private cards of every player as Cactus Kev integers.
+    community_cards : Sequence[int]
+        The community cards as Cactus Kev integers.
+    n_private : int, optional
+        The number of private cards that must be included in the hand (default is 0).
+        A value of 0 means any number of private cards can be used.
+
+    Returns
+    -------
+    list[tuple[int, tuple[int, ...]]]
+        The rank and the card indices of the best hand of every player, as returned
+        by `best_hand`.
+    """
+    flush_lookup = FLUSH_LOOKUP
+    unsuited_lookup = UNSUITED_LOOKUP
+    n_community = len(community_cards)
+    plans: dict[int, tuple] = {}
+    results = []
+
+    for cards in private_cards:
+        n_hole = len(cards)
+        parts = plans.get(n_hole)
+        if parts is None:
+            hole_subsets, community_subsets, plan = _combination_plan(
+                n_hole, n_community, n_private
+            )
+            parts = plans[n_hole] = (
+                hole_subsets,
+                _subset_parts(community_cards, community_subsets),
+                plan,
+            )
+        hole_subsets, (c_ands, c_ors, c_products), plan = parts
+        h_ands, h_ors, h_products = _subset_parts(cards, hole_subsets)
+
+        best_rank = MAX_RANK + 1
+        best_indices: tuple[int, ...] = ()
+        n_cards = n_hole + n_community
+        target = (
+            eval7((*cards, *community_cards))
+            if n_private == 0 and 5 <= n_cards <= 7
+            else 0
+        )
+        for h, c, indices in plan:
+            if h_ands[h] & c_ands[c]:
+                rank = flush_lookup[(h_ors[h] | c_ors[c]) >> 16]
+            else:
+                rank = unsuited_lookup[h_products[h] * c_products[c]]
+            if rank < best_rank:
+                best_rank = rank
+                best_indices = indices
+                if rank == target:
+                    break
+        results.append((best_rank, best_indices))
+
+    return results
@@ -4,7 +4,19 @@ from itertools import combinations
 if TYPE_CHECKING:  # pragma: no cover
     from ..card import Card
 
-from ..enums import HandType
+from ..enums import (
+    HandType,
+    HIGH_CARD,
+    PAIR,
+    TWO_PAIR,
+    THREE_OF_A_KIND,
+    STRAIGHT,
+    FLUSH,
+    FULL_HOUSE,
+    FOUR_OF_A_KIND,
+    STRAIGHT_FLUSH,
+    ROYAL_FLUSH,
+)
 
 
 __all__ = ["score_hand", "find_highest_scoring_hand"]
@@ -140,7 +152,7 @@ def score_hand(hand: list["Card"]) -> Tuple["HandType", float]:
             if straight_high_card == 0:  # Only wheel, no higher straight
                 straight_high_card = 5  # Wheel is 5-high
 
-    handtype = HandType.HIGH_CARD
+    handtype = HIGH_CARD
     score = 0.0
 
     # Royal Flush: A-K-Q-J-10 all same suit
@@ -149,53 +161,53 @@ def score_hand(hand: list["Card"]) -> Tuple["HandType", float]:
         and is_straight
         and set([14, 13, 12, 11, 10]).issubset(set(rank_values))
     ):
-        handtype = HandType.ROYAL_FLUSH
+        handtype = ROYAL_FLUSH
         score = 1000.0
 
     # Straight Flush
     elif is_flush and is_straight:
-        handtype = HandType.STRAIGHT_FLUSH
+        handtype = STRAIGHT_FLUSH
         score = 900 + straight_high_card / 100
 
     # Four of a Kind
     elif 4 in rnum:
-        handtype = HandType.FOUR_OF_A_KIND
+        handtype = FOUR_OF_A_KIND
         score = _check_four_of_a_kind(rank_values)
 
     # Full House
     elif 3 in rnum and 2 in rnum:
-        handtype = HandType.FULL_HOUSE
+        handtype = FULL_HOUSE
         score = _check_full_house(rank_values)
 
     # Flush
     elif is_flush:
-        handtype = HandType.FLUSH
+        handtype = FLUSH
         n = sorted(rank_values, reverse=True)
         score = 600 + sum([n[i] / (100 ** (i + 1)) for i in range(len(n))])
 
     # Straight
     elif is_straight:
-        handtype = HandType.STRAIGHT
+        handtype = STRAIGHT
         score = 500 + straight_high_card / 100
 
     # Three of a Kind
     elif 3 in rnum:
-        handtype = HandType.THREE_OF_A_KIND
+        handtype = THREE_OF_A_KIND
         score = _check_three_of_a_kind(rank_values)
 
     # Two Pair
     elif rnum.count(2) >= 4:  # At least 2 pairs
-        handtype = HandType.TWO_PAIR
+        handtype = TWO_PAIR
         score = _check_two_pair(rank_values)
 
     # Pair
     elif 2 in rnum:
-        handtype = HandType.PAIR
+        handtype = PAIR
         score = _check_pair(rank_values)
 
     # High Card
     else:
-        handtype = HandType.HIGH_CARD
+        handtype = HIGH_CARD
         n = sorted(rank_values, reverse=True)
         score = 100 + sum([n[i] / (100 ** (i + 1)) for i in range(len(n))])
 
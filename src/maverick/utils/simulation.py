@@ -0,0 +1,91 @@
+from typing import TYPE_CHECKING, Callable, Optional, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import repeat
+import multiprocessing
+import random
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..game import Game
+
+__all__ = ["simulate_games"]
+
+
+def _play_game(game_factory: Callable[[], "Game"], seed: int) -> dict[str, int]:
+    """Play a game created by the factory with a seeded random number generator."""
+    random.seed(seed)
+    game = game_factory()
+    players = list(game.state.players)
+    game.start()
+    return {player.name: player.state.stack for player in players}
+
+
+def simulate_games(
+    game_factory: Callable[[], "Game"],
+    n_games: int,
+    *,
+    seeds: Optional[Sequence[int]] = None,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> list[dict[str, int]]:
+    """
+    Play independent games in parallel worker processes.
+
+    Games do not share any state, so a batch of simulated games scales with the
+    number of processor cores, unlike threads which are serialized by the
+    interpreter lock. The workers are started with the ``spawn`` method, since forking
+    a process that runs other threads, e.g. after :meth:`Game.astart`, may deadlock.
+
+    .. versionadded:: 0.3.0
+
+    Parameters
+    ----------
+    game_factory : Callable[[], Game]
+        A function returning a new game with its players added. It is called once in
+        a worker process for every game, hence it must be picklable, e.g. a function
+        defined at the top level of a module or a ``functools.partial`` of one.
+    n_games : int
+        The number of games to play.
+    seeds : Sequence[int], optional
+        The seed of the random number generator for every game. If not provided, the
+        seeds are drawn from the random number generator of the calling process,
+        which makes the results reproducible when that one is seeded.
+    max_workers : int, optional
+        The maximum number of worker processes. Defaults to the number of processors.
+    executor : concurrent.futures.Executor, optional
+        The executor to play the games in, instead of a new pool of spawned worker
+        processes. It is not shut down. An executor running the games in threads of
+        this process must run one game at a time, since the games seed the shared
+        random number generator. ``max_workers`` is ignored if it is provided.
+
+    Returns
+    -------
+    list[dict[str, int]]
+        The final stack of every player of the game, by player name, for every game
+        in the order of the seeds. Names are unique within a game, so the results of
+        different games can be aggregated by player.
+
+    Examples
+    --------
+    >>> from functools import partial
+    >>> from maverick import Game, PlayerState
+    >>> from maverick.players import CallBot
+    >>> from maverick.utils import simulate_games
+    >>> def heads_up(max_hands: int) -> Game:
+    ...     game = Game(small_blind=1, big_blind=2, max_hands=max_hands, log_events=False)
+    ...     for name in ("A", "B"):
+    ...         game.add_player(CallBot(name=name, state=PlayerState(stack=100)))
+    ...     return game
+    >>> results = simulate_games(partial(heads_up, 10), 100)  # doctest: +SKIP
+    """
+    if seeds is None:
+        seeds = [random.randrange(2**32) for _ in range(n_games)]
+    elif len(seeds) != n_games:
+        raise ValueError("The number of seeds must match the number of games.")
+
+    if executor is not None:
+        return list(executor.map(_play_game, repeat(game_factory), seeds))
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return list(executor.map(_play_game, repeat(game_factory), seeds))
@@ -284,6 +284,27 @@ class TestEventBusEdgeCases(unittest.TestCase):
         bus.subscribe(GameEventType.GAME_STARTED, handler)
         self.assertEqual(len(called), 0)
 
+    def test_eventbus_has_subscribers(self):
+        """Test that subscribers are counted by event type."""
+        from maverick.eventbus import EventBus
+        from maverick.enums import GameEventType
+        from maverick.events import GameEvent
+
+        bus = EventBus()
+        self.assertFalse(bus.has_subscribers(GameEventType.GAME_STARTED))
+
+        token = bus.subscribe(GameEventType.GAME_STARTED, lambda e, g: None)
+        bus.subscribe(GameEventType.GAME_STARTED, lambda e, g: None, once=True)
+        self.assertTrue(bus.has_subscribers(GameEventType.GAME_STARTED))
+        self.assertFalse(bus.has_subscribers(GameEventType.GAME_ENDED))
+
+        bus.emit(GameEvent(type=GameEventType.GAME_STARTED, hand_number=0), None)
+        bus.unsubscribe("unknown")
+        self.assertTrue(bus.has_subscribers(GameEventType.GAME_STARTED))
+
+        bus.unsubscribe(token)
+        self.assertFalse(bus.has_subscribers(GameEventType.GAME_STARTED))
+
 
 class TestGameStateEdgeCases(unittest.TestCase):
     """Test GameState edge cases."""
@@ -4,7 +4,7 @@ import unittest
 from typing import TYPE_CHECKING
 
 from maverick import Game
-from maverick.enums import ActionType, PlayerStateType
+from maverick.enums import ActionType, PlayerStateType, Street
 from maverick.player import Player
 from maverick.playeraction import PlayerAction
 from maverick.playerstate import PlayerState
@@ -108,7 +108,7 @@ class TestMinimumRaiseTracking(unittest.TestCase):
         self.assertEqual(game.state.last_raise_size, 0)  # Reset after betting round
 
         game.state.current_bet = 0
-        game._deal_flop()
+        game._deal_street(Street.FLOP, 3)
         game.state.current_player_index = 0
         p1.state.state_type = PlayerStateType.ACTIVE
 
@@ -375,6 +375,47 @@ class TestShortStackCall(unittest.TestCase):
         self.assertNotIn(ActionType.CALL, valid_actions)
 
 
+class TestValidActions(unittest.TestCase):
+    """Test the valid actions offered to a player in different situations."""
+
+    def _valid_actions(self, *, stack, player_bet, table_bet, last_raise_size=20):
+        game = Game(small_blind=10, big_blind=20)
+        p1 = MockPlayer(id="p1", name="P1", state=PlayerState(stack=stack), actions=[])
+        game.add_player(p1)
+        game.state.current_bet = table_bet
+        game.state.last_raise_size = last_raise_size
+        p1.state.current_bet = player_bet
+        return game._get_valid_actions(p1)
+
+    def test_no_bet_to_face(self):
+        """Test the actions available when nobody has bet."""
+        self.assertEqual(
+            self._valid_actions(stack=100, player_bet=0, table_bet=0),
+            [ActionType.FOLD, ActionType.CHECK, ActionType.BET, ActionType.ALL_IN],
+        )
+
+    def test_facing_a_bet(self):
+        """Test the actions available when facing a bet."""
+        self.assertEqual(
+            self._valid_actions(stack=100, player_bet=0, table_bet=20),
+            [ActionType.FOLD, ActionType.CALL, ActionType.RAISE, ActionType.ALL_IN],
+        )
+
+    def test_facing_a_bet_without_chips_to_raise(self):
+        """Test that RAISE is not offered when the stack is too short."""
+        self.assertEqual(
+            self._valid_actions(stack=30, player_bet=0, table_bet=20),
+            [ActionType.FOLD, ActionType.CALL, ActionType.ALL_IN],
+        )
+
+    def test_big_blind_option(self):
+        """Test the actions of a player who already matched the table bet."""
+        self.assertEqual(
+            self._valid_actions(stack=100, player_bet=20, table_bet=20),
+            [ActionType.FOLD, ActionType.CHECK, ActionType.RAISE, ActionType.ALL_IN],
+        )
+
+
 class TestRaiseBySemantics(unittest.TestCase):
     """Test that raise actions use raise-by semantics, not raise-to."""
 
@@ -498,6 +539,42 @@ class TestBettingRoundCompletion(unittest.TestCase):
 
         self.assertTrue(game.state.is_betting_round_complete())
 
+    def test_betting_round_completion_conditions(self):
+        """Test each condition that completes or keeps open a betting round."""
+        game = Game(small_blind=10, big_blind=20)
+        players = [
+            MockPlayer(id=f"p{i}", name=f"P{i}", state=PlayerState(stack=100))
+            for i in range(3)
+        ]
+        for player in players:
+            game.add_player(player)
+        state = game.state
+        state.current_bet = 20
+        for player in players:
+            player.state.current_bet = 20
+            player.state.acted_this_street = True
+        self.assertTrue(state.is_betting_round_complete())
+
+        # an active player still to act keeps the round open
+        players[2].state.acted_this_street = False
+        self.assertFalse(state.is_betting_round_complete())
+
+        # unless everyone else has folded
+        players[0].state.state_type = PlayerStateType.FOLDED
+        players[1].state.state_type = PlayerStateType.FOLDED
+        self.assertTrue(state.is_betting_round_complete())
+
+        # an all-in player does not need to act or match the bet
+        players[1].state.state_type = PlayerStateType.ALL_IN
+        players[1].state.current_bet = 10
+        self.assertFalse(state.is_betting_round_complete())
+        players[2].state.acted_this_street = True
+        self.assertTrue(state.is_betting_round_complete())
+
+        # an active player who has not matched the bet keeps the round open
+        players[2].state.current_bet = 10
+        self.assertFalse(state.is_betting_round_complete())
+
 
 class TestShowdownStateMachine(unittest.TestCase):
     """Test that state machine doesn't advance player after SHOWDOWN."""
@@ -652,7 +729,7 @@ class TestReopenLogicWithZeroRaise(unittest.TestCase):
         p2.state.state_type = PlayerStateType.FOLDED
 
         game._complete_betting_round()
-        game._deal_flop()
+        game._deal_street(Street.FLOP, 3)
         self.assertEqual(game.state.last_raise_size, 0)
 
 
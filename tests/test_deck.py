@@ -1,8 +1,11 @@
 """Tests for the Deck class."""
 
+import random
 import unittest
 
-from maverick import Deck
+from pydantic import ValidationError
+
+from maverick import Deck, Rank
 
 
 class TestDeckDealEdgeCases(unittest.TestCase):
@@ -91,5 +94,39 @@ class TestDeckDealEdgeCases(unittest.TestCase):
             deck.shuffle(n=-1)
 
 
+class TestDeckDeal(unittest.TestCase):
+    """Test the cards dealt by Deck.deal()."""
+
+    def test_dealt_cards_are_removed(self):
+        """Test that dealt cards leave the deck and are distinct."""
+        deck = Deck.build(shuffle=True)
+        dealt = deck.deal(7)
+        self.assertEqual(len(deck.cards), 45)
+        self.assertEqual(len({card.code() for card in dealt}), 7)
+        for card in dealt:
+            self.assertNotIn(card, deck.cards)
+
+    def test_deal_is_a_random_sample_of_the_cards(self):
+        """Test that a seeded deal matches random.sample on the cards."""
+        deck = Deck.build()
+        expected = random.Random(42).sample(list(deck.cards), 5)
+        random.seed(42)
+        self.assertEqual(deck.deal(5), expected)
+
+    def test_decks_are_independent(self):
+        """Test that dealing from one deck does not affect another one."""
+        deck1 = Deck.build()
+        deck2 = Deck.build()
+        deck1.deal(10)
+        self.assertEqual(len(deck2.cards), 52)
+
+    def test_shared_cards_cannot_be_mutated(self):
+        """Test that the cards shared by all decks are immutable."""
+        card = Deck.build().cards[0]
+        with self.assertRaises(ValidationError):
+            card.rank = Rank.ACE
+        self.assertEqual(Deck.build().cards[0], card)
+
+
 if __name__ == "__main__":
     unittest.main()
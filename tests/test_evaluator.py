@@ -0,0 +1,185 @@
+"""Tests for the lookup table based hand evaluator."""
+
+import itertools
+import random
+import unittest
+from collections import Counter
+
+from maverick import Card, Deck, HandType
+from maverick.utils.scoring import score_hand, find_highest_scoring_hand
+from maverick.utils.evaluator import (
+    FLUSH_LOOKUP,
+    UNSUITED_LOOKUP,
+    MAX_RANK,
+    card_to_int,
+    eval5,
+    eval7,
+    best_hand,
+    best_hands,
+    hand_type_from_rank,
+    score_from_rank,
+)
+
+
+def _cards(codes: str) -> list[Card]:
+    suits = {"h": "H", "d": "D", "c": "C", "s": "S"}
+    ranks = {"T": 10, "J": 11, "Q": 12, "K": 13, "A": 14}
+    return [
+        Card(suit=suits[c[1]], rank=ranks.get(c[0]) or int(c[0])) for c in codes.split()
+    ]
+
+
+def _ints(codes: str) -> list[int]:
+    return [card_to_int(card) for card in _cards(codes)]
+
+
+class TestLookupTables(unittest.TestCase):
+    """Test the structure of the lookup tables."""
+
+    def test_number_of_equivalence_classes(self):
+        """Test that there are 7462 distinct ranks."""
+        ranks = set(FLUSH_LOOKUP.values()) | set(UNSUITED_LOOKUP.values())
+        self.assertEqual(len(ranks), MAX_RANK)
+        self.assertEqual(min(ranks), 1)
+        self.assertEqual(max(ranks), MAX_RANK)
+
+    def test_card_encoding_is_unique(self):
+        """Test that every card of the deck has a distinct encoding."""
+        ints = {card_to_int(card) for card in Deck.build().cards}
+        self.assertEqual(len(ints), 52)
+
+    def test_card_int_value(self):
+        """Test that cards expose their encoding without affecting equality."""
+        card = Card(suit="H", rank=14)
+        self.assertEqual(card.int_value, card_to_int(card))
+        self.assertEqual(card, Card(suit="H", rank=14))
+        self.assertNotIn("int_value", card.model_dump())
+
+
+class TestEval5(unittest.TestCase):
+    """Test evaluation of 5-card hands."""
+
+    def test_extreme_hands(self):
+        """Test the strongest and the weakest hands."""
+        self.assertEqual(eval5(*_ints("As Ks Qs Js Ts")), 1)
+        self.assertEqual(eval5(*_ints("7h 5d 4c 3s 2h")), MAX_RANK)
+
+    def test_wheel_is_the_weakest_straight(self):
+        """Test that A-2-3-4-5 ranks below 6-high straights."""
+        wheel = eval5(*_ints("Ah 2d 3c 4s 5h"))
+        six_high = eval5(*_ints("2d 3c 4s 5h 6h"))
+        self.assertGreater(wheel, six_high)
+
+    def test_order_agrees_with_score_hand(self):
+        """Test that ranks order random hands the same way as score_hand."""
+        rng = random.Random(0)
+        cards = Deck.build().cards
+        hands = [rng.sample(cards, 5) for _ in range(2000)]
+        for a, b in zip(hands[::2], hands[1::2]):
+            rank_a = eval5(*(card_to_int(c) for c in a))
+            rank_b = eval5(*(card_to_int(c) for c in b))
+            score_a = score_hand(a)[1]
+            score_b = score_hand(b)[1]
+            self.assertEqual(rank_a < rank_b, score_a > score_b)
+            self.assertEqual(rank_a == rank_b, score_a == score_b)
+
+    def test_hand_type_from_rank(self):
+        """Test that the rank bands agree with the hand types of score_hand."""
+        self.assertEqual(hand_type_from_rank(1), HandType.ROYAL_FLUSH)
+        self.assertEqual(hand_type_from_rank(2), HandType.STRAIGHT_FLUSH)
+        self.assertEqual(hand_type_from_rank(MAX_RANK), HandType.HIGH_CARD)
+        rng = random.Random(4)
+        cards = Deck.build().cards
+        for _ in range(2000):
+            hand = rng.sample(cards, 5)
+            rank = eval5(*(card_to_int(c) for c in hand))
+            self.assertEqual(hand_type_from_rank(rank), score_hand(hand)[0])
+
+    def test_score_from_rank(self):
+        """Test that the score of a rank is the score of its hands."""
+        self.assertEqual(score_from_rank(1), score_hand(_cards("As Ks Qs Js Ts"))[1])
+        self.assertEqual(
+            score_from_rank(MAX_RANK), score_hand(_cards("7s 5h 4d 3c 2s"))[1]
+        )
+        rng = random.Random(5)
+        cards = Deck.build().cards
+        for _ in range(2000):
+            hand = rng.sample(cards, 5)
+            rank = eval5(*(card_to_int(c) for c in hand))
+            self.assertEqual(score_from_rank(rank), score_hand(hand)[1])
+
+
+class TestEval7(unittest.TestCase):
+    """Test evaluation of the best hand from more than 5 cards."""
+
+    def test_eval7_agrees_with_find_highest_scoring_hand(self):
+        """Test that eval7 finds a hand as strong as the exhaustive search."""
+        rng = random.Random(1)
+        cards = Deck.build().cards
+        for _ in range(200):
+            seven = rng.sample(cards, 7)
+            hand, hand_type, _ = find_highest_scoring_hand(seven[:2], seven[2:])
+            rank = eval7([card_to_int(c) for c in seven])
+            self.assertEqual(rank, eval5(*(card_to_int(c) for c in hand)))
+            self.assertEqual(score_hand(hand)[0], hand_type)
+
+    def test_eval7_memoization_is_consistent(self):
+        """Test that repeated and permuted compositions give the same rank."""
+        rng = random.Random(3)
+        cards = [card_to_int(c) for c in Deck.build().cards]
+        for n in (5, 6, 7, 8):
+            for _ in range(200):
+                hand = rng.sample(cards, n)
+                expected = min(
+                    eval5(*combo) for combo in itertools.combinations(hand, 5)
+                )
+                self.assertEqual(eval7(hand), expected)
+                self.assertEqual(eval7(hand[::-1]), expected)
+
+    def test_best_hand_indices(self):
+        """Test that best_hand returns the indices of the best cards."""
+        private = _ints("Ah Kh")
+        community = _ints("Qh Jh Th 2c 3d")
+        rank, indices = best_hand(private, community)
+        self.assertEqual(rank, 1)
+        self.assertEqual(indices, (0, 1, 2, 3, 4))
+
+    def test_best_hand_respects_n_private(self):
+        """Test that exactly n_private hole cards are used."""
+        private = _ints("2c 3d")
+        community = _ints("Ah Kh Qh Jh Th")
+        rank, indices = best_hand(private, community, n_private=2)
+        self.assertEqual(sum(i < 2 for i in indices), 2)
+        self.assertGreater(rank, 1)
+
+    def test_best_hands_agrees_with_best_hand(self):
+        """Test that evaluating players together gives the same hands."""
+        rng = random.Random(6)
+        cards = [card_to_int(c) for c in Deck.build().cards]
+        for n_private in (0, 1, 2):
+            for n_community in (3, 4, 5):
+                for _ in range(100):
+                    n_players = rng.randint(2, 6)
+                    dealt = rng.sample(cards, 2 * n_players + n_community)
+                    private = [dealt[2 * i : 2 * i + 2] for i in range(n_players)]
+                    community = dealt[2 * n_players :]
+                    self.assertEqual(
+                        best_hands(private, community, n_private=n_private),
+                        [best_hand(p, community, n_private=n_private) for p in private],
+                    )
+
+    def test_hand_type_counts(self):
+        """Test the hand type distribution of a sample of hands."""
+        counts = Counter()
+        rng = random.Random(2)
+        cards = Deck.build().cards
+        for _ in range(500):
+            hand = rng.sample(cards, 5)
+            rank = eval5(*(card_to_int(c) for c in hand))
+            counts[score_hand(hand)[0]] += 1
+            self.assertTrue(1 <= rank <= MAX_RANK)
+        self.assertGreater(counts[HandType.HIGH_CARD], counts[HandType.TWO_PAIR])
+
+
+if __name__ == "__main__":
+    unittest.main()
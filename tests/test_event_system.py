@@ -99,6 +99,27 @@ class TestGameEventModel(unittest.TestCase):
                 extra_field="should_fail",  # This should be rejected
             )
 
+    def test_game_event_validates_type(self):
+        """Test that GameEvent rejects an unknown event type."""
+        with self.assertRaises(ValueError):
+            GameEvent(type="not_an_event", hand_number=1)
+
+    def test_game_event_model_dump_round_trip(self):
+        """Test that dumped events validate back to the same event."""
+        event = GameEvent(
+            type=GameEventType.PLAYER_ACTION_TAKEN,
+            hand_number=1,
+            player_id="p1",
+            action=PlayerAction(player_id="p1", action_type=ActionType.CALL),
+            payload={"amount": 10},
+        )
+
+        self.assertEqual(GameEvent.model_validate(event.model_dump()), event)
+        self.assertEqual(GameEvent.model_validate(event.model_dump(mode="json")), event)
+        self.assertIn('"hand_number":1', event.model_dump_json())
+        with self.assertRaises(ValueError):
+            GameEvent.model_validate({**event.model_dump(), "extra_field": 1})
+
 
 class TestEventSubscription(unittest.TestCase):
     """Test event subscription and handler registration."""
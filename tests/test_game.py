@@ -1,6 +1,12 @@
 """Comprehensive tests for the Game class."""
 
+import asyncio
+import functools
+import logging
+import random
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from maverick import (
     Game,
@@ -12,6 +18,7 @@ from maverick import (
     GameEvent,
 )
 from maverick.enums import GameStage
+from maverick.players import CallBot
 
 
 class SimpleTestPlayer(Player):
@@ -187,6 +194,23 @@ class TestAddPlayer(unittest.TestCase):
             game.add_player(p2)
         self.assertIn("Player id 'p1' is already taken", str(context.exception))
 
+    def test_add_player_with_id_of_eliminated_player(self):
+        """Test that the id of an eliminated player is not taken."""
+        game = create_game()
+        players = [
+            SimpleTestPlayer(id=f"p{i}", name=f"P{i}", state=PlayerState(stack=100))
+            for i in range(3)
+        ]
+        for player in players:
+            game.add_player(player)
+        players[0].state.stack = 0
+        game._on_hand_ended()
+        game.state.stage = GameStage.READY
+
+        rejoined = SimpleTestPlayer(id="p0", name="Rejoined")
+        game.add_player(rejoined)
+        self.assertIn(rejoined, game.state.players)
+
     def test_add_player_with_existing_seat_raises_error(self):
         """Test that adding a player to a full table raises ValueError."""
         game = create_game(max_players=9)
@@ -224,6 +248,23 @@ class TestRemovePlayer(unittest.TestCase):
             game.remove_player(player)
         self.assertIn("not found", str(context.exception))
 
+    def test_remove_eliminated_player_raises_error(self):
+        """Test that an eliminated player still seated cannot be removed."""
+        game = create_game()
+        players = [
+            SimpleTestPlayer(id=f"p{i}", name=f"P{i}", state=PlayerState(stack=100))
+            for i in range(3)
+        ]
+        for player in players:
+            game.add_player(player)
+        players[0].state.stack = 0
+        game._on_hand_ended()
+
+        with self.assertRaises(ValueError) as context:
+            game.remove_player(players[0])
+        self.assertIn("not found", str(context.exception))
+        self.assertIs(game.table[players[0].state.seat], players[0])
+
     def test_remove_player_emits_event(self):
         """Test that removing a player emits PLAYER_LEFT event."""
         game = create_game()
@@ -256,6 +297,39 @@ class TestRemovePlayer(unittest.TestCase):
         self.assertEqual(len(game.state.players), 1)
         self.assertEqual(game.state.players[0].id, "p2")
 
+    def test_remove_player_keeps_order_of_remaining_players(self):
+        """Test that removing a player keeps the order of the other players."""
+        game = create_game()
+        players = [SimpleTestPlayer(id=f"p{i}", name=f"Player{i}") for i in range(1, 5)]
+        for player in players:
+            game.add_player(player)
+
+        game.remove_player(players[1])
+
+        self.assertEqual([p.id for p in game.state.players], ["p1", "p3", "p4"])
+        self.assertIsNone(game.table[1])
+
+    def test_remove_player_keeps_the_index_of_players_up_to_date(self):
+        """Test that the players are found by id after removals and eliminations."""
+        game = create_game()
+        players = [
+            SimpleTestPlayer(id=f"p{i}", name=f"P{i}", state=PlayerState(stack=100))
+            for i in range(5)
+        ]
+        for player in players:
+            game.add_player(player)
+
+        game.remove_player(players[1])
+        players[2].state.stack = 0
+        game._on_hand_ended()
+        self.assertEqual(game._player_index, {"p0": 0, "p3": 1, "p4": 2})
+
+        # the player list was changed without the game, the index is rebuilt
+        game.state.players.reverse()
+        game.remove_player(players[4])
+        self.assertEqual([p.id for p in game.state.players], ["p3", "p0"])
+        self.assertEqual(game._player_index, {"p3": 0, "p0": 1})
+
     def remove_player_while_hand_is_in_progress_raises_error(self):
         """Test that removing a player while a hand is in progress raises ValueError."""
         game = create_game()
@@ -387,6 +461,87 @@ class TestStepAndHasEvents(unittest.TestCase):
         result = game.step()
         self.assertFalse(result)
 
+    def test_step_and_start_produce_the_same_events(self):
+        """Test that stepping through a game emits the same events as start."""
+
+        def play(stepwise: bool) -> list[GameEventType]:
+            game = create_game(max_hands=3, first_button_position=0)
+            game.add_player(
+                SimpleTestPlayer(id="p1", name="P1", state=PlayerState(stack=100))
+            )
+            game.add_player(
+                SimpleTestPlayer(id="p2", name="P2", state=PlayerState(stack=100))
+            )
+            if stepwise:
+                game._initialize_game()
+                game._event_queue.append(GameEventType.GAME_STARTED)
+                while game.step():
+                    pass
+            else:
+                game.start()
+            self.assertFalse(game.has_events())
+            return [event.type for event in game.history]
+
+        self.assertEqual(play(stepwise=True), play(stepwise=False))
+
+
+class TestHeadsUpSpecialization(unittest.TestCase):
+    """Test that heads-up hands use the specialized player rotation."""
+
+    def _game_after_blinds(self, n_players: int) -> Game:
+        game = create_game(first_button_position=0)
+        for i in range(n_players):
+            game.add_player(
+                SimpleTestPlayer(id=f"p{i}", name=f"P{i}", state=PlayerState(stack=100))
+            )
+        game._initialize_game()
+        game._start_new_hand()
+        game._deal_hole_cards()
+        game._post_blinds()
+        return game
+
+    def test_seat_order_is_computed_when_hand_starts(self):
+        """Test that the seat order is known before the blinds are posted."""
+        game = create_game(first_button_position=1)
+        for i in range(3):
+            game.add_player(
+                SimpleTestPlayer(id=f"p{i}", name=f"P{i}", state=PlayerState(stack=100))
+            )
+        game._initialize_game()
+        game._start_new_hand()
+        self.assertEqual(game._seat_order, (2, 0, 1))
+        self.assertEqual(game._next_seat[:3], [1, 2, 0])
+
+    def test_heads_up_binds_specialized_method(self):
+        """Test that the heads-up rotation is used with two players."""
+        game = self._game_after_blinds(2)
+        self.assertEqual(
+            game._advance_to_next_player, game._advance_to_next_player_heads_up
+        )
+        # the button posts the small blind and acts first, then the big blind
+        self.assertEqual(game.state.current_player_index, 0)
+        game._advance_to_next_player()
+        self.assertEqual(game.state.current_player_index, 1)
+
+    def test_heads_up_raise_reopens_action_for_the_opponent(self):
+        """Test that a raise heads-up gives the opponent the right to act again."""
+        game = self._game_after_blinds(2)
+        button, big_blind = game.table[0], game.table[1]
+        big_blind.state.acted_this_street = True
+        game._register_player_action(
+            button,
+            PlayerAction(player_id=button.id, action_type=ActionType.RAISE, amount=50),
+        )
+        self.assertFalse(big_blind.state.acted_this_street)
+        self.assertTrue(button.state.acted_this_street)
+        self.assertEqual(game.state.current_player_index, 0)
+
+    def test_multiway_uses_generic_method(self):
+        """Test that the generic rotation is used with more players."""
+        game = self._game_after_blinds(3)
+        self.assertNotIn("_advance_to_next_player", vars(game))
+        self.assertNotIn("_reset_acted_flags_for_reopen", vars(game))
+
 
 class TestGameHistory(unittest.TestCase):
     """Test Game.start method."""
@@ -406,6 +561,189 @@ class TestGameHistory(unittest.TestCase):
         for h in history:
             self.assertIsInstance(h, GameEvent)
 
+    def test_game_history_size(self):
+        """Test that a limited history keeps only the most recent events."""
+        game = create_game(max_hands=1, history_size=3)
+        game.add_player(
+            SimpleTestPlayer(id="p1", name="P1", state=PlayerState(stack=100))
+        )
+        game.add_player(
+            SimpleTestPlayer(id="p2", name="P2", state=PlayerState(stack=100))
+        )
+
+        game.start()
+
+        history = game.history
+        self.assertIsInstance(history, list)
+        self.assertEqual(len(history), 3)
+        self.assertEqual(history[-1].type, GameEventType.GAME_ENDED)
+
+        self.assertEqual(create_game(history_size=0).history, [])
+        with self.assertRaises(ValueError):
+            create_game(history_size=-1)
+
+    def test_events_without_history_only_reach_observers(self):
+        """Test that events are only created for observers without a history."""
+
+        class QuietPlayer(SimpleTestPlayer):
+            observes_events = False
+
+            def on_hand_ended(self, event, game):
+                self.hands = getattr(self, "hands", 0) + 1
+
+        game = create_game(max_hands=2, history_size=0)
+        quiet = QuietPlayer(id="p1", name="P1", state=PlayerState(stack=100))
+        game.add_player(quiet)
+        game.add_player(QuietPlayer(id="p2", name="P2", state=PlayerState(stack=100)))
+        started = []
+        game.subscribe(GameEventType.HAND_STARTED, lambda e, g: started.append(e))
+
+        created = []
+        create_event = game._create_event
+        game._create_event = lambda *args: created.append(args[0]) or create_event(
+            *args
+        )
+        game.start()
+
+        self.assertEqual(game.history, [])
+        self.assertEqual(len(started), 2)
+        self.assertFalse(hasattr(quiet, "hands"))
+        self.assertEqual(set(created), {GameEventType.HAND_STARTED})
+
+    def test_hook_attached_after_joining_without_history(self):
+        """Test that a hook attached to a player after joining is called."""
+        game = create_game(max_hands=2, history_size=0)
+        player = SimpleTestPlayer(id="p1", name="P1", state=PlayerState(stack=100))
+        game.add_player(player)
+        game.add_player(
+            SimpleTestPlayer(id="p2", name="P2", state=PlayerState(stack=100))
+        )
+        ended = []
+        player.on_hand_ended = lambda event, game: ended.append(event)
+
+        game.start()
+
+        self.assertEqual(len(ended), 2)
+
+    def test_player_like_observer_without_history(self):
+        """Test that a player not derived from Player observes every event."""
+
+        def recorded(method):
+            @functools.wraps(method)
+            def wrapper(self, event, game):
+                return method(self, event, game)
+
+            return wrapper
+
+        class PlainPlayer:
+            def __init__(self, id, name, state):
+                self.id, self.name, self.state = id, name, state
+                self.events = []
+
+            def decide_action(self, **kwargs):
+                return PlayerAction(player_id=self.id, action_type=ActionType.FOLD)
+
+            def to_dict(self):
+                return {"id": self.id, "name": self.name}
+
+            @recorded
+            def on_event(self, event, game):
+                self.events.append(event.type)
+
+        def play(history_size):
+            random.seed(7)
+            game = create_game(max_hands=2, history_size=history_size)
+            observer = PlainPlayer(id="p1", name="P1", state=PlayerState(stack=100))
+            game.add_player(observer)
+            game.add_player(
+                SimpleTestPlayer(id="p2", name="P2", state=PlayerState(stack=100))
+            )
+            game.start()
+            return game, observer
+
+        game, observer = play(history_size=0)
+        _, reference = play(history_size=None)
+        self.assertEqual(game.history, [])
+        self.assertIn(GameEventType.PLAYER_ACTION_TAKEN, observer.events)
+        self.assertEqual(observer.events, reference.events)
+        self.assertTrue(game._players_observe_events)
+
+
+class TestGameClone(unittest.TestCase):
+    """Test Game.clone method."""
+
+    def _game_on_the_flop(self) -> Game:
+        game = create_game(max_hands=3, first_button_position=0)
+        for i in range(3):
+            game.add_player(
+                CallBot(id=f"p{i}", name=f"P{i}", state=PlayerState(stack=200))
+            )
+        game._initialize_game()
+        game._event_queue.append(GameEventType.GAME_STARTED)
+        while game.state.stage != GameStage.FLOP:
+            game.step()
+        return game
+
+    def test_clone_is_independent(self):
+        """Test that playing out a clone leaves the original game untouched."""
+        game = self._game_on_the_flop()
+        snapshot = game.state.model_dump(mode="json")
+        events = []
+        game.subscribe(GameEventType.HAND_ENDED, lambda e, g: events.append(e))
+
+        clone = game.clone()
+        self.assertEqual(clone.state.model_dump(mode="json"), snapshot)
+        for original, copied in zip(game.state.players, clone.state.players):
+            self.assertIsNot(original, copied)
+            self.assertIs(clone.table[copied.state.seat], copied)
+
+        while clone.step():
+            pass
+
+        self.assertEqual(clone.state.stage, GameStage.GAME_OVER)
+        self.assertEqual(game.state.model_dump(mode="json"), snapshot)
+        self.assertEqual(game.state.stage, GameStage.FLOP)
+        self.assertEqual(events, [])
+
+    def test_clone_does_not_share_holdings_or_seats(self):
+        """Test that changing the holdings or seats of a clone leaves the original."""
+        game = self._game_on_the_flop()
+        holdings = [list(p.state.holding.cards) for p in game.state.players]
+        next_seat = list(game._next_seat)
+
+        clone = game.clone()
+        self.assertEqual(vars(clone).keys(), vars(game).keys())
+        for player in clone.state.players:
+            player.state.holding.cards.reverse()
+            player.state.holding = None
+        clone._next_seat[:] = [None] * len(next_seat)
+        clone.table.remove_player(clone.state.players[0])
+
+        self.assertEqual([p.state.holding.cards for p in game.state.players], holdings)
+        self.assertEqual(game._next_seat, next_seat)
+        self.assertIs(game.table[0], game.state.players[0])
+
+    def test_clone_plays_out_like_the_original(self):
+        """Test that a clone plays out the same way as the original game."""
+        game = self._game_on_the_flop()
+        clone = game.clone()
+
+        random.seed(7)
+        while clone.step():
+            pass
+        random.seed(7)
+        while game.step():
+            pass
+
+        self.assertEqual(
+            [p.state.stack for p in clone.state.players],
+            [p.state.stack for p in game.state.players],
+        )
+        self.assertEqual(
+            [e.type for e in clone.history],
+            [e.type for e in game.history][-len(clone.history) :],
+        )
+
 
 class TestGameStart(unittest.TestCase):
     """Test Game.start method."""
@@ -441,6 +779,60 @@ class TestGameStart(unittest.TestCase):
         self.assertEqual(len(events), 1)
         self.assertEqual(events[0].type, GameEventType.GAME_STARTED)
 
+    def test_astart_plays_games_concurrently(self):
+        """Test that independent games can be awaited together."""
+        games = []
+        for _ in range(3):
+            game = create_game(max_hands=2)
+            game.add_player(
+                SimpleTestPlayer(id="p1", name="P1", state=PlayerState(stack=100))
+            )
+            game.add_player(
+                SimpleTestPlayer(id="p2", name="P2", state=PlayerState(stack=100))
+            )
+            games.append(game)
+
+        async def play():
+            await asyncio.gather(*(game.astart() for game in games))
+
+        asyncio.run(play())
+
+        for game in games:
+            self.assertEqual(game.state.hand_number, 2)
+            self.assertEqual(game.state.stage, GameStage.GAME_OVER)
+
+    def test_astart_runs_games_at_the_same_time(self):
+        """Test that the decisions of awaited games overlap in time."""
+        # every player waits for a player of the other game at each decision, so
+        # the games only finish if they are played at the same time
+        barrier = threading.Barrier(2, timeout=10)
+
+        class WaitingPlayer(SimpleTestPlayer):
+            def decide_action(self, **kwargs):
+                barrier.wait()
+                return super().decide_action(**kwargs)
+
+        def create_waiting_game() -> Game:
+            game = create_game(max_hands=2, log_events=False)
+            game.add_player(
+                WaitingPlayer(id="p1", name="P1", state=PlayerState(stack=100))
+            )
+            game.add_player(
+                WaitingPlayer(id="p2", name="P2", state=PlayerState(stack=100))
+            )
+            return game
+
+        async def play(executor):
+            games = [create_waiting_game(), create_waiting_game()]
+            await asyncio.gather(*(game.astart(executor) for game in games))
+            return games
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for pool in (None, executor):
+                with self.subTest(executor=pool):
+                    for game in asyncio.run(play(pool)):
+                        self.assertEqual(game.state.stage, GameStage.GAME_OVER)
+
 
 class TestCreateEvent(unittest.TestCase):
     """Test Game._create_event method."""
@@ -568,6 +960,36 @@ class TestGameEdgeCases(unittest.TestCase):
         game = create_game(exc_handling_mode="raise")
         self.assertTrue(game._events._strict)
 
+    def test_winners_in_button_order(self):
+        """Test that split pot winners are ordered clockwise from the button."""
+        game = create_game()
+        players = [
+            SimpleTestPlayer(id=f"p{i}", name=f"P{i}", state=PlayerState(stack=100))
+            for i in range(4)
+        ]
+        for player in players:
+            game.add_player(player)
+        game.state.button_position = 2
+        ordered = game._winners_in_button_order([players[0], players[2], players[3]])
+        self.assertEqual(ordered, [players[3], players[0], players[2]])
+
+    def test_eliminated_players_are_removed_in_place(self):
+        """Test that eliminated players are deleted from the same player list."""
+        game = create_game()
+        players = [
+            SimpleTestPlayer(id=f"p{i}", name=f"P{i}", state=PlayerState(stack=100))
+            for i in range(3)
+        ]
+        for player in players:
+            game.add_player(player)
+        players[0].state.stack = 0
+        players[2].state.stack = 0
+        players_in_game = game.state.players
+
+        self.assertEqual(game._on_hand_ended(), GameEventType.GAME_ENDED)
+        self.assertIs(game.state.players, players_in_game)
+        self.assertEqual(game.state.players, [players[1]])
+
 
 class TestGameLoggingEvents(unittest.TestCase):
     """Test Game logging events functionality."""
@@ -581,6 +1003,99 @@ class TestGameLoggingEvents(unittest.TestCase):
         event = game._create_event(GameEventType.GAME_STARTED)
         game._emit(event)
 
+    def _play_logged_game(self, **kwargs) -> list[str]:
+        game = create_game(max_hands=2, first_button_position=0, **kwargs)
+        game.add_player(
+            SimpleTestPlayer(id="p1", name="P1", state=PlayerState(stack=100))
+        )
+        game.add_player(
+            SimpleTestPlayer(id="p2", name="P2", state=PlayerState(stack=100))
+        )
+        with self.assertLogs("maverick", level="INFO") as logs:
+            game.start()
+        return [record.getMessage() for record in logs.records]
+
+    def test_buffered_logs_are_written_per_hand(self):
+        """Test that buffered logging writes the same messages in fewer records."""
+        unbuffered = self._play_logged_game()
+        buffered = self._play_logged_game(buffer_logs=True)
+        self.assertLess(len(buffered), len(unbuffered))
+        self.assertEqual("\n".join(buffered), "\n".join(unbuffered))
+        self.assertTrue(buffered[-1].endswith("Game ended"))
+
+    def test_buffered_logs_of_a_hand_include_eliminations(self):
+        """Test that the messages after the end of a hand are written with it."""
+        game = create_game(buffer_logs=True)
+        players = [
+            SimpleTestPlayer(id=f"p{i}", name=f"P{i}", state=PlayerState(stack=100))
+            for i in range(2)
+        ]
+        for player in players:
+            game.add_player(player)
+        players[0].state.stack = 0
+        with self.assertLogs("maverick", level="INFO") as logs:
+            game._on_hand_ended()
+        self.assertEqual(len(logs.records), 1)
+        message = logs.records[0].getMessage()
+        self.assertIn("Hand ended", message)
+        self.assertIn("Player P0 has been eliminated from the game.", message)
+        self.assertIn("Player P0 has left the table.", message)
+        self.assertIn("Not enough players to continue", message)
+        self.assertEqual(game._log_buffer, [])
+
+    def test_buffered_logs_include_debug_messages(self):
+        """Test that enabling debug messages does not defeat the buffering."""
+        game = create_game(buffer_logs=True)
+        with self.assertLogs("maverick", level="DEBUG") as logs:
+            game._log("first", logging.DEBUG, stage_prefix=False)
+            game._log("second", logging.INFO, stage_prefix=False)
+            game._log("third", logging.DEBUG, stage_prefix=False)
+            game._flush_logs()
+            game._log("fourth", logging.DEBUG, stage_prefix=False)
+            game._flush_logs()
+        self.assertEqual(
+            [(r.levelno, r.getMessage()) for r in logs.records],
+            [(logging.INFO, "first\nsecond\nthird"), (logging.DEBUG, "fourth")],
+        )
+
+    def test_buffered_logs_are_written_when_a_player_raises(self):
+        """Test that buffered messages are not lost if the game is interrupted."""
+
+        class FailingPlayer(SimpleTestPlayer):
+            def decide_action(self, **kwargs):
+                raise RuntimeError("player failed")
+
+        game = create_game(max_hands=2, first_button_position=0, buffer_logs=True)
+        with self.assertLogs("maverick", level="INFO") as logs:
+            game.add_player(
+                FailingPlayer(id="p1", name="P1", state=PlayerState(stack=100))
+            )
+            game.add_player(
+                FailingPlayer(id="p2", name="P2", state=PlayerState(stack=100))
+            )
+            with self.assertRaises(RuntimeError):
+                game.start()
+        messages = "\n".join(record.getMessage() for record in logs.records)
+        self.assertIn("Player P1 joined the game.", messages)
+        self.assertIn("Game started.", messages)
+        self.assertIn("Posting big blind", messages)
+        self.assertEqual(game._log_buffer, [])
+
+    def test_lazy_messages_are_formatted_only_when_logged(self):
+        """Test that a callable message is only called if the level is enabled."""
+        game = create_game()
+        calls = []
+
+        def message():
+            calls.append(1)
+            return "lazy message"
+
+        with self.assertLogs("maverick", level="INFO") as logs:
+            game._log(message, stage_prefix=False)
+            game._log(message, loglevel=logging.DEBUG, stage_prefix=False)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(logs.records[-1].getMessage(), "lazy message")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@
 
 import unittest
 
+from maverick import enums
 from maverick.enums import HandType
 
 
@@ -148,5 +149,20 @@ class TestHandTypeComparisons(unittest.TestCase):
             self.assertTrue(all_hands[i + 1] >= all_hands[i])
 
 
+class TestModuleLevelMembers(unittest.TestCase):
+    """Test the module level exports of enum members."""
+
+    def test_members_are_exported(self):
+        """Test that the members are available as module level names."""
+        for enum_cls in (enums.Suit, enums.Rank, enums.HandType):
+            for name, member in enum_cls.__members__.items():
+                self.assertIs(getattr(enums, name), member)
+                self.assertIn(name, enums.__all__)
+
+    def test_member_repr_unchanged(self):
+        """Test that exporting the members does not change their repr."""
+        self.assertEqual(repr(enums.FLUSH), "<HandType.FLUSH: 5>")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,67 @@
+"""Tests for playing games in parallel processes."""
+
+import random
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from unittest import mock
+
+from maverick import Game, PlayerState
+from maverick.players import CallBot, AggressiveBot
+from maverick.utils import simulate_games
+from maverick.utils.simulation import _play_game
+
+
+def _create_game(max_hands: int) -> Game:
+    game = Game(small_blind=1, big_blind=2, max_hands=max_hands, log_events=False)
+    game.add_player(CallBot(name="P1", state=PlayerState(stack=100)))
+    game.add_player(AggressiveBot(name="P2", state=PlayerState(stack=100)))
+    return game
+
+
+class TestSimulateGames(unittest.TestCase):
+    """Test simulate_games."""
+
+    def setUp(self):
+        # a single thread plays the games one after the other, without starting
+        # worker processes
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(self.executor.shutdown)
+
+    def test_results_match_games_played_in_process(self):
+        """Test that the games are played with their seeds in order."""
+        factory = partial(_create_game, 5)
+        results = simulate_games(factory, 3, seeds=[1, 2, 3], executor=self.executor)
+        self.assertEqual(results, [_play_game(factory, seed) for seed in (1, 2, 3)])
+        for result in results:
+            self.assertEqual(set(result), {"P1", "P2"})
+            self.assertEqual(sum(result.values()), 200)
+
+    def test_seeds_are_drawn_from_the_random_module(self):
+        """Test that seeding the random module makes the results reproducible."""
+        factory = partial(_create_game, 3)
+        random.seed(0)
+        first = simulate_games(factory, 2, executor=self.executor)
+        random.seed(0)
+        second = simulate_games(factory, 2, executor=self.executor)
+        self.assertEqual(first, second)
+
+    def test_workers_are_spawned(self):
+        """Test that the games are played in spawned worker processes."""
+        factory = partial(_create_game, 3)
+        with mock.patch(
+            "maverick.utils.simulation.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+        ) as executor:
+            results = simulate_games(factory, 2, seeds=[1, 2], max_workers=2)
+        context = executor.call_args.kwargs["mp_context"]
+        self.assertEqual(context.get_start_method(), "spawn")
+        self.assertEqual(results, [_play_game(factory, seed) for seed in (1, 2)])
+
+    def test_number_of_seeds_must_match(self):
+        """Test that a seed is required for every game."""
+        with self.assertRaises(ValueError):
+            simulate_games(partial(_create_game, 1), 2, seeds=[1])
+
+
+if __name__ == "__main__":
+    unittest.main()